@@ -0,0 +1,361 @@
+"""Micro-benchmarks for Word-Maze's non-GUI modules.
+
+Covers GameState (guess, use_hint, is_won, masked), word_loader.random_word
+over synthetic word packs of several sizes, progress_manager.update for
+every backend, project.simulate_round throughput, the batch engines of
+src.simulation (pure Python and NumPy) on the same rounds, and the solver's
+tables and letter ranking over the largest pack. Each case reports the
+best per-operation time over --repeat runs. With --baseline the results
+are compared against a stored report and the run exits with status 1 if
+any case is slower than baseline * (1 + tolerance); the progress_manager
+cases time real disk writes and get the looser --io-tolerance. A baseline
+saved with --runs N keeps each case's slowest result over N full runs.
+
+Synthetic datasets are generated from --seed, so the same seed always
+gives the same words. They are compiled to word packs once and cached in
+--data-dir.
+
+Usage:
+    python -m benchmarks.core_bench --output core.json
+    python -m benchmarks.core_bench --baseline benchmarks/core_baseline.json
+    python -m benchmarks.core_bench --sizes 1000,10000000 --save-baseline new.json
+    python -m benchmarks.core_bench --runs 5 --save-baseline benchmarks/core_baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import string
+import sys
+import tempfile
+import time
+
+from project import simulate_round
+from src import progress_manager, simulation, solver, word_loader, word_pack
+from src.game_state import GameState
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DIFFICULTIES = ("easy", "medium", "hard")
+CATEGORIES = 8
+TOLERANCE = 0.25
+# cases that time disk writes (fsync, locking) swing far more between runs
+IO_CASES = ("progress_manager.",)
+IO_TOLERANCE = 2.0
+
+
+def synthetic_dataset(size: int, seed: int = 0, categories: int = CATEGORIES) -> dict:
+    """Build a reproducible {category: {difficulty: [words]}} dataset of `size` words.
+
+    Words are 3-12 random upper-case letters, dealt round-robin over
+    `categories` categories and the three difficulties.
+    """
+    rng = random.Random(f"{seed}:{size}")
+    pools = [[] for _ in range(categories * len(DIFFICULTIES))]
+    letters = string.ascii_uppercase
+    for i in range(size):
+        pools[i % len(pools)].append("".join(rng.choices(letters, k=rng.randint(3, 12))))
+
+    it = iter(pools)
+    return {f"cat{c:02d}": {diff: next(it) for diff in DIFFICULTIES} for c in range(categories)}
+
+
+def synthetic_pack(size: int, seed: int, data_dir: str) -> str:
+    """Return the path of the word pack for (size, seed), compiling it on first use."""
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"synthetic-{size}-{seed}-v{word_pack.VERSION}.wmp")
+    if not os.path.exists(path):
+        tmp = path + ".tmp"
+        word_pack.compile_pack(synthetic_dataset(size, seed), tmp)
+        os.replace(tmp, path)
+    return path
+
+
+def best_per_op(case, repeat: int) -> float:
+    """Run `case` (which returns (seconds, ops)) `repeat` times; best seconds per op."""
+    best = None
+    for _ in range(repeat):
+        elapsed, ops = case()
+        per_op = elapsed / max(1, ops)
+        best = per_op if best is None else min(best, per_op)
+    return best
+
+
+def _states(words, n):
+    return [GameState(words[i % len(words)]) for i in range(n)]
+
+
+def game_state_cases(words: list, rng: random.Random, n: int = 2000) -> dict:
+    letters = list(string.ascii_uppercase)
+    order = letters[:]
+    rng.shuffle(order)
+
+    def guess():
+        states = _states(words, n)
+        t = time.perf_counter()
+        for state in states:
+            for letter in order:
+                state.guess(letter)
+        return time.perf_counter() - t, n * len(order)
+
+    def use_hint():
+        states = _states(words, n)
+        for state in states:
+            state.score = 10 * state.hint_cost
+        t = time.perf_counter()
+        for state in states:
+            state.use_hint()
+        return time.perf_counter() - t, n
+
+    def is_won():
+        states = _states(words, n)
+        t = time.perf_counter()
+        for state in states:
+            for _ in range(10):
+                state.is_won()
+        return time.perf_counter() - t, 10 * n
+
+    def masked():
+        # one guess then a read, the pattern the UI follows on every keypress
+        states = _states(words, n)
+        t = time.perf_counter()
+        for state in states:
+            for letter in order[:8]:
+                state.guess(letter)
+                state.masked()
+        return time.perf_counter() - t, 8 * n
+
+    return {
+        "game_state.guess": guess,
+        "game_state.use_hint": use_hint,
+        "game_state.is_won": is_won,
+        "game_state.masked": masked,
+    }
+
+
+def random_word_case(pack_path: str, n: int = 20000):
+    def case():
+        loader = word_loader.WordLoader()
+        loader.load(pack_path)
+        keys = [("cat00", "easy"), ("cat03", None), (None, "hard"), (None, None)]
+        for cat, diff in keys:
+            loader.random_word(cat, diff)
+        t = time.perf_counter()
+        for i in range(n):
+            cat, diff = keys[i & 3]
+            loader.random_word(cat, diff)
+        return time.perf_counter() - t, n
+
+    return case
+
+
+def progress_case(backend: str, n: int):
+    def case():
+        folder = tempfile.mkdtemp(prefix="word-maze-bench-")
+        path = os.path.join(folder, "save.sqlite" if backend == "sqlite" else "save.json")
+        store = progress_manager.backends[backend](path)
+        store.load()
+        try:
+            t = time.perf_counter()
+            for i in range(n):
+                store.update({"player": "bench", "round_score": i % 100, "won": i % 3 != 0})
+            return time.perf_counter() - t, n
+        finally:
+            if hasattr(store, "close"):
+                store.close()
+            shutil.rmtree(folder, ignore_errors=True)
+
+    return case
+
+
+def simulate_round_case(words: list, rng: random.Random, n: int = 2000):
+    rounds = []
+    for i in range(n):
+        guesses = list(string.ascii_uppercase)
+        rng.shuffle(guesses)
+        rounds.append((words[i % len(words)], guesses, i % 2 == 0))
+
+    def case():
+        t = time.perf_counter()
+        for word, guesses, use_hint in rounds:
+            simulate_round(word, guesses, use_hint=use_hint)
+        return time.perf_counter() - t, n
+
+    return case
+
+
+def simulate_batch_case(words: list, rng: random.Random, vectorize: bool, n: int = 50000):
+    rounds = []
+    for i in range(n):
+        guesses = list(string.ascii_uppercase)
+        rng.shuffle(guesses)
+        rounds.append((words[i % len(words)], guesses))
+
+    def case():
+        t = time.perf_counter()
+        simulation.simulate(rounds, True, random.Random(0), vectorize)
+        return time.perf_counter() - t, n
+
+    return case
+
+
+def solver_cases(pack_path: str, rng: random.Random, n: int = 50) -> dict:
+    """Solver cases over the whole pack: building the per-length tables, and
+    playing rounds with a fresh Solver that ranks the letters after every guess."""
+    loader = word_loader.WordLoader()
+    loader.load(pack_path)
+    pool = loader.words()
+    words = [pool[rng.randrange(len(pool))] for _ in range(n)]
+    lengths = sorted({len(w) for w in words})
+    index = solver.WordIndex(pool)
+
+    def table():
+        built = solver.WordIndex(pool)
+        t = time.perf_counter()
+        for length in lengths:
+            built.table(length)
+        return time.perf_counter() - t, len(lengths)
+
+    def rank_letters():
+        for length in lengths:
+            index.table(length)
+        ops = 0
+        t = time.perf_counter()
+        for word in words:
+            state = GameState(word)
+            s = solver.Solver(state, index=index)
+            while not state.is_won() and s.count():
+                state.guess(s.best_letter())
+                s.update()
+                ops += 1
+        return time.perf_counter() - t, ops
+
+    size = len(pool)
+    return {f"solver.table[{size}]": table, f"solver.rank_letters[{size}]": rank_letters}
+
+
+def bench(sizes=DEFAULT_SIZES, seed: int = 0, repeat: int = 3, data_dir: str = None) -> dict:
+    """Run every case and return the report dict (times in microseconds per op)."""
+    data_dir = data_dir or os.path.join(tempfile.gettempdir(), "word-maze-bench")
+    rng = random.Random(seed)
+    random.seed(seed)
+    words = word_loader.WordLoader(synthetic_dataset(1000, seed)).words()
+
+    cases = dict(game_state_cases(words, rng))
+    for size in sizes:
+        cases[f"word_loader.random_word[{size}]"] = random_word_case(synthetic_pack(size, seed, data_dir))
+    for backend, n in (("json", 50), ("journal", 500), ("sqlite", 500)):
+        cases[f"progress_manager.update[{backend}]"] = progress_case(backend, n)
+    cases["project.simulate_round"] = simulate_round_case(words, rng)
+    cases.update(solver_cases(synthetic_pack(max(sizes), seed, data_dir), random.Random(seed)))
+    cases["simulation.simulate[python]"] = simulate_batch_case(words, random.Random(seed), False)
+    if simulation.np is not None:
+        cases["simulation.simulate[numpy]"] = simulate_batch_case(words, random.Random(seed), True)
+
+    results = {name: {"us_per_op": best_per_op(case, repeat) * 1e6} for name, case in cases.items()}
+    for entry in results.values():
+        entry["ops_per_s"] = 1e6 / entry["us_per_op"] if entry["us_per_op"] else None
+
+    return {
+        "benchmark": "core",
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "params": {"sizes": list(sizes), "seed": seed, "repeat": repeat},
+        "results": results,
+    }
+
+
+def merge_runs(reports: list) -> dict:
+    """Fold several reports into one that keeps each case's slowest result.
+
+    Used for baselines on machines whose speed drifts between runs, so the
+    baseline is the ceiling this machine actually reaches, not its luckiest run.
+    """
+    merged = dict(reports[0], results={})
+    for name in reports[0]["results"]:
+        entry = max((r["results"][name] for r in reports), key=lambda e: e["us_per_op"])
+        merged["results"][name] = dict(entry)
+    merged["params"] = dict(reports[0]["params"], runs=len(reports))
+    return merged
+
+
+def compare(report: dict, baseline: dict, tolerance: float = TOLERANCE,
+            io_tolerance: float = IO_TOLERANCE) -> dict:
+    """Compare us_per_op per case against a baseline report.
+
+    A case is "regressed" above baseline * (1 + tolerance), "improved" below
+    baseline / (1 + tolerance), "ok" in between, and "new" if the baseline
+    doesn't have it. Cases in IO_CASES use `io_tolerance` instead.
+    """
+    out = {}
+    base = baseline.get("results", {})
+    for name, entry in report["results"].items():
+        current = entry["us_per_op"]
+        if name not in base:
+            out[name] = {"status": "new", "current_us": current}
+            continue
+        before = base[name]["us_per_op"]
+        ratio = current / before if before else float("inf")
+        allowed = io_tolerance if name.startswith(IO_CASES) else tolerance
+        if ratio > 1 + allowed:
+            status = "regressed"
+        elif ratio < 1 / (1 + allowed):
+            status = "improved"
+        else:
+            status = "ok"
+        out[name] = {"status": status, "baseline_us": before, "current_us": current, "ratio": ratio}
+    return out
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Word-Maze core micro-benchmarks.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated synthetic pack sizes in words (default 1k..1M)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for synthetic data and guesses")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the best one counts")
+    parser.add_argument("--data-dir", help="where synthetic packs are cached (default: system temp)")
+    parser.add_argument("--baseline", help="baseline report to compare against")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="allowed slowdown before a case counts as regressed (default 0.25)")
+    parser.add_argument("--io-tolerance", type=float, default=IO_TOLERANCE,
+                        help="the same for the progress_manager (disk I/O) cases (default 2.0)")
+    parser.add_argument("--save-baseline", help="also write this run's report here")
+    parser.add_argument("--runs", type=int, default=1,
+                        help="full runs for --save-baseline; each case keeps its slowest (default 1)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    report = bench(sizes, args.seed, args.repeat, args.data_dir)
+    if args.save_baseline:
+        runs = [report] + [bench(sizes, args.seed, args.repeat, args.data_dir) for _ in range(args.runs - 1)]
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(json.dumps(merge_runs(runs), indent=2) + "\n")
+
+    regressed = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            comparison = compare(report, json.load(f), args.tolerance, args.io_tolerance)
+        report["comparison"] = {"tolerance": args.tolerance, "io_tolerance": args.io_tolerance, "cases": comparison}
+        regressed = [name for name, entry in comparison.items() if entry["status"] == "regressed"]
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for name in regressed:
+        print(f"regressed: {name}", file=sys.stderr)
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
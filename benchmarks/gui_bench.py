@@ -0,0 +1,175 @@
+"""Headless GUI benchmark for Word-Maze.
+
+Runs WordMazeWindow on Qt's offscreen platform and plays scripted rounds
+through the same entry points the UI uses: the menu's start signal,
+GameScreen.handle_physical_key, the hint button handler and the result
+screen's next-round signal. Each event is timed up to a synchronous repaint
+of the window. The output is a JSON report of startup phases, per-event
+latency percentiles and widget counts.
+
+Usage:
+    python -m benchmarks.gui_bench --rounds 50 --output gui.json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import string
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QT_VERSION_STR  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from src import main_window, word_loader  # noqa: E402
+
+
+def percentiles(samples: list) -> dict:
+    """Summarize latencies (seconds) as milliseconds using nearest-rank percentiles."""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def rank(p: float) -> float:
+        return ordered[max(0, math.ceil(p / 100.0 * len(ordered)) - 1)] * 1000.0
+
+    return {
+        "count": len(ordered),
+        "mean_ms": sum(ordered) / len(ordered) * 1000.0,
+        "p50_ms": rank(50),
+        "p90_ms": rank(90),
+        "p99_ms": rank(99),
+        "max_ms": ordered[-1] * 1000.0,
+    }
+
+
+class Recorder:
+    """Times a UI action up to the end of a synchronous repaint."""
+
+    def __init__(self, app: QApplication, window):
+        self.app = app
+        self.window = window
+        self.samples = {}
+
+    def measure(self, action, *args) -> float:
+        t = time.perf_counter()
+        action(*args)
+        self.app.processEvents()
+        self.window.repaint()
+        return time.perf_counter() - t
+
+    def __call__(self, event: str, action, *args) -> None:
+        self.samples.setdefault(event, []).append(self.measure(action, *args))
+
+
+def play_round(rec: Recorder, rng: random.Random, use_hint: bool) -> None:
+    window = rec.window
+    game = window.game
+    letters = list(string.ascii_uppercase)
+    rng.shuffle(letters)
+
+    hinted = False
+    for letter in letters:
+        if window.stack.currentWidget() is not game:
+            break
+        before = game.state.score
+        elapsed = rec.measure(game.handle_physical_key, letter)
+        # the keypress that ends the round also saves and shows the result screen
+        finished = window.stack.currentWidget() is not game
+        rec.samples.setdefault("finish" if finished else "key", []).append(elapsed)
+        if finished:
+            break
+        if use_hint and not hinted and game.state.score > before:
+            hinted = True
+            rec("hint", game.use_hint)
+
+
+def bench(rounds: int = 30, seed: int = 0, words: str = None, hint_every: int = 2) -> dict:
+    """Run the scripted session and return the report dict."""
+    random.seed(seed)
+    rng = random.Random(seed)
+
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    progress_dir = tempfile.mkdtemp(prefix="word-maze-bench-")
+    progress_path = os.path.join(progress_dir, "save_data.json")
+
+    t = time.perf_counter()
+    window = main_window.run(progress_path, words)
+    painted = []
+    window.first_painted.connect(lambda: painted.append(time.perf_counter()))
+    while not painted and time.perf_counter() - t < 10:
+        app.processEvents()
+    startup_ms = ((painted[0] if painted else time.perf_counter()) - t) * 1000.0
+    phases = {}
+    prev = main_window._startup_t0
+    for phase, stamp in main_window._startup_phases:
+        phases[phase] = (stamp - prev) * 1000.0
+        prev = stamp
+    widgets = {"startup": len(app.allWidgets())}
+
+    rec = Recorder(app, window)
+    category = window._categories_pretty()[0]
+    difficulty = "Easy"
+
+    rec("start_round", window.menu.start_game_signal.emit, "bench", category, difficulty)
+    for i in range(rounds):
+        if i:
+            rec("next_round", window.result.next_round.emit)
+        play_round(rec, rng, use_hint=hint_every > 0 and i % hint_every == 0)
+        if i == 0:
+            widgets["after_first_round"] = len(app.allWidgets())
+    widgets["end"] = len(app.allWidgets())
+
+    window._progress_writer.close()
+    window.close()
+    app.processEvents()
+    shutil.rmtree(progress_dir, ignore_errors=True)
+
+    return {
+        "benchmark": "gui",
+        "environment": {
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "platform": os.environ.get("QT_QPA_PLATFORM"),
+            "machine": platform.machine(),
+        },
+        "params": {
+            "rounds": rounds,
+            "seed": seed,
+            "words": len(word_loader.words()),
+            "ui_scale": main_window.UI_SCALE,
+            "window": [window.width(), window.height()],
+        },
+        "startup": {"total_ms": startup_ms, "phases_ms": phases},
+        "events": {event: percentiles(samples) for event, samples in sorted(rec.samples.items())},
+        "widgets": widgets,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Headless Word-Maze GUI benchmark.")
+    parser.add_argument("--rounds", type=int, default=30, help="rounds to play (default 30)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for words, guesses and hints")
+    parser.add_argument("--words", help="dataset to load instead of the game's default")
+    parser.add_argument("--hint-every", type=int, default=2, help="take a hint every Nth round (0 = never)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = bench(args.rounds, args.seed, args.words, args.hint_every)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
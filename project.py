@@ -18,11 +18,16 @@ from dataclasses import dataclass
 import json
 import os
 import random
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 
 from src.game_state import GameState
+from src import json_stream
+from src import simulation
 from src import word_loader
+from src import word_pack
+from src import word_shards
 from src import progress_manager
+from src import solver
 
 
 def repo_root() -> str:
@@ -40,11 +45,54 @@ def words_file() -> str:
     return data_path("words.json")
 
 
+def pack_file() -> str:
+    """Default path to the compiled word pack (built from words.json)."""
+    return data_path("words.wmp")
+
+
+def compile_word_pack(file_path: Optional[str] = None, target: Optional[str] = None) -> str:
+    """Validate words.json and compile it into a binary word pack.
+
+    Returns:
+        The path of the written pack.
+    """
+    src = file_path or words_file()
+    dst = target or pack_file()
+    with open(src, "r", encoding="utf-8") as f:
+        data = _validate_words_schema(json.load(f))
+    word_pack.compile_pack(data, dst)
+    return dst
+
+
+def shards_dir() -> str:
+    """Default directory for the split dataset (manifest plus word pack)."""
+    return data_path("words")
+
+
+def split_word_data(file_path: Optional[str] = None, target: Optional[str] = None) -> str:
+    """Validate words.json and split it into a category manifest plus a word pack.
+
+    Returns:
+        The directory holding the manifest and the pack.
+    """
+    src = file_path or words_file()
+    dst = target or shards_dir()
+    with open(src, "r", encoding="utf-8") as f:
+        data = _validate_words_schema(json.load(f))
+    word_shards.split_dataset(data, dst)
+    return dst
+
+
 def progress_file() -> str:
     """Default path to the progress save file used by the game."""
     return data_path("save_data.json")
 
 
+def progress_db_file() -> str:
+    """Default path to the SQLite progress database (imports save_data.json once)."""
+    return data_path("save_data.sqlite")
+
+
 def _validate_words_schema(data: Any) -> Dict[str, Dict[str, list]]:
     """Validate the expected schema of words.json.
 
@@ -70,20 +118,126 @@ def _validate_words_schema(data: Any) -> Dict[str, Dict[str, list]]:
     return data  # type: ignore[return-value]
 
 
-def load_word_data(file_path: Optional[str] = None) -> Dict[str, Dict[str, list]]:
+def _stream_words_schema(
+    fp: BinaryIO, *, collect: bool = True, chunk_size: int = json_stream.CHUNK_SIZE
+) -> Optional[Dict[str, Dict[str, list]]]:
+    """Validate words.json from a binary stream, one JSON event at a time.
+
+    Applies the same rules as `_validate_words_schema` but stops at the first
+    violation, reporting its path and byte offset. Memory stays bounded by the
+    read chunk unless `collect` is set, in which case the words are gathered
+    into the returned dict as they are read.
+    """
+    events = json_stream.events(fp, chunk_size)
+
+    def fail(msg: str, path: str, offset: int):
+        raise ValueError(f"{msg} at {path} (byte {offset})")
+
+    def key(path: str, name: str) -> str:
+        return f"{path}[{json.dumps(name, ensure_ascii=False)}]"
+
+    data: Optional[Dict[str, Dict[str, list]]] = {} if collect else None
+
+    ev, _, off = next(events)
+    if ev != "start_map":
+        fail("words data must be a non-empty dict", "$", off)
+
+    n_categories = 0
+    for ev, category, off in events:
+        if ev == "end_map":
+            break
+        cat_path = key("$", category)
+        if not category:
+            fail("category names must be non-empty strings", cat_path, off)
+
+        ev, _, off = next(events)
+        if ev != "start_map":
+            fail("each category must map to a non-empty dict", cat_path, off)
+
+        by_diff: Dict[str, list] = {}
+        n_difficulties = 0
+        for ev, diff, off in events:
+            if ev == "end_map":
+                break
+            diff_path = key(cat_path, diff)
+            if not diff:
+                fail("difficulty names must be non-empty strings", diff_path, off)
+
+            ev, _, off = next(events)
+            if ev != "start_array":
+                fail("each difficulty must map to a non-empty list", diff_path, off)
+
+            words = []
+            n_words = 0
+            for ev, word, off in events:
+                if ev == "end_array":
+                    break
+                if ev != "string" or not word:
+                    fail("all words must be non-empty strings", f"{diff_path}[{n_words}]", off)
+                n_words += 1
+                if data is not None:
+                    words.append(word)
+
+            if not n_words:
+                fail("each difficulty must map to a non-empty list", diff_path, off)
+            n_difficulties += 1
+            if data is not None:
+                by_diff[diff] = words
+
+        if not n_difficulties:
+            fail("each category must map to a non-empty dict", cat_path, off)
+        n_categories += 1
+        if data is not None:
+            data[category] = by_diff
+
+    if not n_categories:
+        fail("words data must be a non-empty dict", "$", off)
+
+    # drain the generator so trailing garbage is reported too
+    for _ in events:
+        pass
+
+    return data
+
+
+def validate_words_file(file_path: Optional[str] = None) -> None:
+    """Stream-validate a words.json file without loading it into memory.
+
+    Raises:
+        ValueError: naming the first offending path and its byte offset.
+    """
+    with open(file_path or words_file(), "rb") as f:
+        _stream_words_schema(f, collect=False)
+
+
+def load_word_data(file_path: Optional[str] = None, *, stream: bool = False) -> Dict[str, Dict[str, list]]:
     """Load words data from JSON and prime src.word_loader.
 
+    Compiled word packs (see src/word_pack.py) are detected and memory-mapped
+    instead, and sharded datasets (see src/word_shards.py) are opened lazily;
+    both were validated when they were built.
+
     Args:
         file_path: Optional override (useful for tests).
+        stream: Validate and collect the words in a single streaming pass,
+            failing fast on the first schema violation (useful for huge or
+            untrusted files).
 
     Returns:
-        The parsed JSON object.
+        The parsed JSON object (or the pack's/shards' lazy equivalent).
     """
     path = file_path or words_file()
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if word_shards.is_shards(path) or word_pack.is_pack(path):
+        word_loader.load(path)
+        return word_loader.data
+
+    if stream:
+        with open(path, "rb") as fb:
+            data = _stream_words_schema(fb)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = _validate_words_schema(json.load(f))
 
-    data = _validate_words_schema(data)
     word_loader.load_data(data)
     return data
 
@@ -95,6 +249,19 @@ def get_categories(file_path: Optional[str] = None) -> list[str]:
     return word_loader.categories()
 
 
+def get_word_stats(file_path: Optional[str] = None) -> dict:
+    """Return the loaded dataset's summary statistics.
+
+    Keys are words, min_length, max_length, mean_length, lengths (word
+    count per length), letters (occurrences per letter) and counts
+    ({category: {difficulty: words}}). They are computed once at load time,
+    or read from the word pack header / shard manifest.
+    """
+    if not word_loader.data:
+        load_word_data(file_path)
+    return word_loader.stats()
+
+
 def get_random_word(
     category: Optional[str] = None,
     difficulty: Optional[str] = None,
@@ -104,25 +271,37 @@ def get_random_word(
 ) -> str:
     """Pick a random word, optionally filtered by category/difficulty.
 
-    Mirrors src.word_loader.random_word behavior (no immediate repeats)
-    via word_loader.used.
+    Mirrors src.word_loader.random_word behavior: each filter draws from its
+    own shuffled deck, so words don't repeat until that pool is exhausted.
+    Passing `seed` makes the draw deterministic for a freshly loaded dataset.
     """
     if not word_loader.data:
         load_word_data(file_path)
 
-    all_words = word_loader.words(category, difficulty)
-    if not all_words:
+    if not word_loader.words(category, difficulty):
         raise ValueError("no words match the given filters")
 
-    available = [w for w in all_words if w not in word_loader.used]
-    if not available:
-        word_loader.used.clear()
-        available = list(all_words)
+    rng = random.Random(seed) if seed is not None else None
+    return word_loader.random_word(category, difficulty, rng=rng)
 
-    rng = random.Random(seed) if seed is not None else random
-    word = rng.choice(available)
-    word_loader.used.add(word)
-    return word
+
+def make_solver(
+    state: GameState,
+    category: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    *,
+    file_path: Optional[str] = None,
+) -> solver.Solver:
+    """Create a solver that tracks `state` against the (category, difficulty) pool.
+
+    Call `update()` after each guess or hint to narrow the candidates
+    incrementally, then use `candidates()`, `count()`, `rank_letters(by=...)`
+    ("information" or "elimination") or `best_letter()`. The pool's bitset
+    index is built once per pool and word length and shared across solvers.
+    """
+    if not word_loader.data:
+        load_word_data(file_path)
+    return solver.Solver(state, category, difficulty)
 
 
 @dataclass(frozen=True)
@@ -159,28 +338,181 @@ def simulate_round(word: str, guesses: Iterable[str], *, use_hint: bool = False)
     )
 
 
-def get_progress(path: Optional[str] = None) -> dict:
-    """Load progress dict (creates a default file if missing)."""
+@dataclass(frozen=True, eq=False)
+class RoundBatch:
+    """Column-oriented results of simulate_rounds(), one entry per round.
+
+    Columns are NumPy arrays when the vectorized engine ran, lists otherwise.
+    """
+
+    round_score: Sequence[int]
+    won: Sequence[bool]
+    bonus: Sequence[int]
+    mistakes: Sequence[int]
+
+    def __len__(self) -> int:
+        return len(self.round_score)
+
+    def __getitem__(self, i: int) -> RoundResult:
+        return RoundResult(
+            round_score=int(self.round_score[i]),
+            won=bool(self.won[i]),
+            bonus=int(self.bonus[i]),
+            mistakes=int(self.mistakes[i]),
+        )
+
+    def __iter__(self) -> Iterator[RoundResult]:
+        return (self[i] for i in range(len(self)))
+
+
+def simulate_rounds(
+    rounds: Iterable[Tuple[str, Iterable[str]]],
+    *,
+    use_hint: bool = False,
+    seed: Optional[int] = None,
+    vectorize: Optional[bool] = None,
+) -> RoundBatch:
+    """Replay many (word, guesses) rounds at once.
+
+    Results match calling simulate_round() on each pair in order. Without a
+    `seed`, hint letters come from the global `random` state just as they do
+    there; with one, from a private generator.
+
+    Args:
+        vectorize: Force (True) or skip (False) the NumPy engine; by default
+            it is used when NumPy is installed and the batch has at least
+            simulation.VECTORIZE_MIN rounds.
+    """
+    rng = random.Random(seed) if seed is not None else random
+    score, won, bonus, mistakes = simulation.simulate(rounds, use_hint, rng, vectorize)
+    return RoundBatch(round_score=score, won=won, bonus=bonus, mistakes=mistakes)
+
+
+def simulate_rounds_parallel(
+    jobs: Iterable[Tuple[Optional[str], Iterable[str]]],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = simulation.CHUNK_SIZE,
+    seed: int = 0,
+    use_hint: bool = False,
+    category: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    file_path: Optional[str] = None,
+    vectorize: Optional[bool] = None,
+) -> Iterator[RoundResult]:
+    """Replay (word, guesses) jobs across a process pool, streaming results in order.
+
+    A job whose word is None plays a word drawn from the dataset at
+    `file_path` (filtered by category/difficulty). Each worker loads that
+    dataset once. Results are reproducible for a given `seed` and
+    `chunk_size` no matter how many workers run.
+
+    Args:
+        workers: Process count; defaults to the CPU count, 1 runs inline.
+        chunk_size: Rounds handed to a worker at a time.
+    """
+    chunks = simulation.simulate_parallel(
+        jobs,
+        source=file_path or words_file(),
+        workers=workers,
+        chunk_size=chunk_size,
+        seed=seed,
+        use_hint=use_hint,
+        category=category,
+        difficulty=difficulty,
+        vectorize=vectorize,
+    )
+    for columns in chunks:
+        yield from RoundBatch(*columns)
+
+
+def get_progress(path: Optional[str] = None, *, backend: Optional[str] = None) -> dict:
+    """Load progress dict (creates a default file if missing).
+
+    Args:
+        backend: Storage backend from progress_manager.backends
+            ("json", "journal" or "sqlite"); *.sqlite/*.db paths pick
+            "sqlite" automatically.
+    """
     p = path or progress_file()
     os.makedirs(os.path.dirname(p), exist_ok=True)
-    return progress_manager.load_progress(p)
+    return progress_manager.load_progress(p, backend)
 
 
-def update_progress(round_score: int, won: bool, *, path: Optional[str] = None) -> dict:
+def update_progress(
+    round_score: int, won: bool, *, path: Optional[str] = None, backend: Optional[str] = None
+) -> dict:
     """Update progress with a finished round result and return the updated dict."""
     if not isinstance(round_score, int):
         raise TypeError("round_score must be int")
 
     p = path or progress_file()
     os.makedirs(os.path.dirname(p), exist_ok=True)
-    return progress_manager.update_progress(p, {"round_score": round_score, "won": bool(won)})
+    return progress_manager.update_progress(p, {"round_score": round_score, "won": bool(won)}, backend)
+
 
+@dataclass(frozen=True)
+class ProgressUpdate:
+    """Outcome of update_progress_many(): totals after the batch and what the batch added."""
+
+    totals: dict
+    delta: dict
+
+
+def update_progress_many(
+    results: Iterable[RoundResult | Tuple[int, bool]],
+    *,
+    path: Optional[str] = None,
+    backend: Optional[str] = None,
+) -> ProgressUpdate:
+    """Apply many finished rounds with a single load/save cycle.
+
+    Args:
+        results: RoundResult objects or (round_score, won) pairs.
+        backend: Storage backend, as for update_progress().
 
-def reset_progress(path: Optional[str] = None) -> None:
+    Raises:
+        TypeError: If a round_score is not an int or won is not a bool.
+            The whole batch is checked before anything is written.
+    """
+    payloads = []
+    for r in results:
+        round_score, won = (r.round_score, r.won) if isinstance(r, RoundResult) else r
+        if not isinstance(round_score, int):
+            raise TypeError("round_score must be int")
+        if not isinstance(won, bool):
+            raise TypeError("won must be bool")
+        payloads.append({"round_score": round_score, "won": won})
+
+    delta = dict.fromkeys(progress_manager.default, 0)
+    for payload in payloads:
+        progress_manager.apply(delta, payload)
+
+    p = path or progress_file()
+    os.makedirs(os.path.dirname(p), exist_ok=True)
+    totals = progress_manager.update_progress_many(p, payloads, backend)
+    return ProgressUpdate(totals=totals, delta=delta)
+
+
+def reset_progress(path: Optional[str] = None, *, backend: Optional[str] = None) -> None:
     """Reset progress back to defaults."""
     p = path or progress_file()
     os.makedirs(os.path.dirname(p), exist_ok=True)
-    progress_manager.reset_progress(p)
+    progress_manager.reset_progress(p, backend)
+
+
+def get_leaderboard(limit: int = 10, *, path: Optional[str] = None) -> list[dict]:
+    """Top players by total score from the SQLite progress database."""
+    p = path or progress_db_file()
+    os.makedirs(os.path.dirname(p), exist_ok=True)
+    return progress_manager.leaderboard(p, limit)
+
+
+def get_player_stats(player: str, *, path: Optional[str] = None) -> dict:
+    """Aggregate stats (totals, best round) for one player from the SQLite database."""
+    p = path or progress_db_file()
+    os.makedirs(os.path.dirname(p), exist_ok=True)
+    return progress_manager.player_stats(p, player)
 
 
 def main() -> None:
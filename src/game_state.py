@@ -1,7 +1,20 @@
 import random
 
+A = ord("A")
+
 
 class GameState:
+    # Everything per session is a handful of ints: revealed positions are a
+    # bitmask over the word and guessed letters a 26-bit mask over A-Z (the
+    # rare other letter goes in a tuple), so is_won() is a counter check and
+    # a guess is one scan of the word. masked() and wrong_letters() are
+    # derived from those masks and cached until the next change.
+    # __slots__ keeps idle sessions small.
+    __slots__ = (
+        "word", "life", "score", "mistakes", "hint_used",
+        "_guessed", "_other", "_revealed", "_hidden", "_masked", "_wrong",
+    )
+
     lives = 8
     hint_cost = 20
     correct_letter = 10
@@ -15,27 +28,71 @@ class GameState:
         self.life = self.lives
         self.score = 0
         self.mistakes = 0
-
-        self.guessed = set()
-        self.revealed = set()
         self.hint_used = False
 
+        self._guessed = 0
+        self._other = ()
+        self._revealed = 0
         for i, ch in enumerate(self.word):
             if not ch.isalpha():
-                self.revealed.add(i)
+                self._revealed |= 1 << i
+
+        self._hidden = len(self.word) - self._revealed.bit_count()
+        self._masked = None
+        self._wrong = ()
 
     @property
     def lives_left(self) -> int:
         return self.life
 
+    @property
+    def guessed(self) -> set:
+        # read-only snapshot of the guessed letters
+        letters = {chr(A + i) for i in range(26) if self._guessed >> i & 1}
+        letters.update(self._other)
+        return letters
+
+    @property
+    def revealed(self) -> set:
+        # read-only snapshot; use is_revealed() in hot paths
+        return {i for i in range(len(self.word)) if self._revealed >> i & 1}
+
+    @property
+    def revealed_mask(self) -> int:
+        return self._revealed
+
+    def is_revealed(self, index: int) -> bool:
+        return bool(self._revealed >> index & 1)
+
+    def _positions(self, letter: str) -> int:
+        mask = 0
+        if len(letter) == 1:
+            i = self.word.find(letter)
+            while i >= 0:
+                mask |= 1 << i
+                i = self.word.find(letter, i + 1)
+        return mask
+
+    def _reveal(self, mask: int) -> None:
+        new = mask & ~self._revealed
+        if new:
+            self._hidden -= new.bit_count()
+            self._revealed |= new
+            self._masked = None
+
     def masked(self) -> str:
-        result = []
-        for i, ch in enumerate(self.word):
-            if i in self.revealed:
-                result.append(ch)
-            else:
-                result.append("_")
-        return " ".join(result)
+        if self._masked is None:
+            revealed = self._revealed
+            self._masked = " ".join([ch if revealed >> i & 1 else "_" for i, ch in enumerate(self.word)])
+        return self._masked
+
+    def wrong_letters(self) -> tuple:
+        # sorted by code point: A-Z first, then any other letters
+        if self._wrong is None:
+            wrong = [chr(A + i) for i in range(26) if self._guessed >> i & 1 and chr(A + i) not in self.word]
+            wrong += sorted(ch for ch in self._other if not self._positions(ch))
+            self._wrong = tuple(wrong)
+        return self._wrong
 
     def guess(self, letter: str) -> dict:
         if not letter or len(letter) != 1 or not letter.isalpha():
@@ -43,18 +100,22 @@ class GameState:
 
         letter = letter.upper()
 
-        if letter in self.guessed:
-            return {"already_guessed": True, "lives": self.life, "score": self.score}
-
-        self.guessed.add(letter)
+        code = ord(letter) - A if len(letter) == 1 else -1
+        if 0 <= code < 26:
+            if self._guessed >> code & 1:
+                return {"already_guessed": True, "lives": self.life, "score": self.score}
+            self._guessed |= 1 << code
+        else:
+            if letter in self._other:
+                return {"already_guessed": True, "lives": self.life, "score": self.score}
+            self._other += (letter,)
 
-        indices = [i for i, ch in enumerate(self.word) if ch == letter]
+        mask = self._positions(letter)
 
-        if indices:
-            for i in indices:
-                self.revealed.add(i)
+        if mask:
+            self._reveal(mask)
 
-            gained = len(indices) * self.correct_letter
+            gained = mask.bit_count() * self.correct_letter
             self.score += gained
 
             return {
@@ -66,6 +127,7 @@ class GameState:
 
         self.life -= 1
         self.mistakes += 1
+        self._wrong = None
 
         return {
             "correct": False,
@@ -84,16 +146,14 @@ class GameState:
                 "score": self.score
             }
 
-        hidden_indices = [i for i in range(len(self.word)) if i not in self.revealed]
+        hidden_indices = [i for i in range(len(self.word)) if not self._revealed >> i & 1]
         if not hidden_indices:
             return {"used": False, "score": self.score}
 
         index = random.choice(hidden_indices)
         letter = self.word[index]
 
-        for i, ch in enumerate(self.word):
-            if ch == letter:
-                self.revealed.add(i)
+        self._reveal(self._positions(letter))
 
         self.score -= self.hint_cost
         self.hint_used = True
@@ -105,7 +165,7 @@ class GameState:
         }
 
     def is_won(self) -> bool:
-        return all(i in self.revealed for i in range(len(self.word)))
+        return self._hidden == 0
 
     def is_lost(self) -> bool:
         return self.life <= 0
@@ -0,0 +1,164 @@
+import json
+import re
+
+# Incremental JSON reader: tokens() scans a binary file chunk by chunk and
+# events() turns the tokens into ijson-style (event, value, offset) triples.
+# Only the current chunk and the token being read are held in memory, so a
+# consumer can stop at the first thing it doesn't like without paying for
+# the rest of the document.
+
+CHUNK_SIZE = 64 * 1024
+MAX_TOKEN = 1024 * 1024
+
+_WS = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"(?:[^"\\\x00-\x1f]|\\.)*"')
+_NUMBER = re.compile(rb"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_LITERAL = re.compile(rb"true|false|null")
+_BARE = re.compile(rb'[^ \t\n\r{}\[\]:,"]*')
+_LITERALS = {b"true": ("boolean", True), b"false": ("boolean", False), b"null": ("null", None)}
+_PUNCT = frozenset(b"{}[]:,")
+
+
+class JSONStreamError(ValueError):
+    def __init__(self, msg, offset):
+        super().__init__(f"{msg} (byte {offset})")
+        self.offset = offset
+
+
+def _decode_string(raw, offset):
+    try:
+        if b"\\" not in raw:
+            return raw[1:-1].decode("utf-8")
+        return json.loads(raw.decode("utf-8"))
+    except ValueError:
+        raise JSONStreamError("invalid string", offset) from None
+
+
+def _decode_number(raw):
+    if raw.isdigit() or (raw[:1] == b"-" and raw[1:].isdigit()):
+        return int(raw)
+    return float(raw)
+
+
+def tokens(fp, chunk_size=CHUNK_SIZE, max_token=MAX_TOKEN):
+    buf = b""
+    base = 0
+    pos = 0
+    eof = False
+
+    while True:
+        pos = _WS.match(buf, pos).end()
+        if pos == len(buf):
+            if eof:
+                return
+            base += pos
+            buf = fp.read(chunk_size)
+            pos = 0
+            eof = not buf
+            continue
+
+        c = buf[pos]
+        if c in _PUNCT:
+            yield chr(c), None, base + pos
+            pos += 1
+            continue
+
+        if c == 0x22:
+            m = _STRING.match(buf, pos)
+            complete = m is not None
+        else:
+            # a number or literal runs up to the next delimiter; if that is
+            # past the end of the buffer it may continue in the next chunk
+            end = _BARE.match(buf, pos).end()
+            complete = end < len(buf) or eof
+            if complete:
+                m = (_NUMBER if c == 0x2D or 0x30 <= c <= 0x39 else _LITERAL).fullmatch(buf, pos, end)
+                if m is None:
+                    raise JSONStreamError("invalid JSON", base + pos)
+
+        if not complete:
+            if eof:
+                raise JSONStreamError("invalid JSON", base + pos)
+            if len(buf) - pos > max_token:
+                raise JSONStreamError("token too long", base + pos)
+            more = fp.read(chunk_size)
+            eof = not more
+            base += pos
+            buf = buf[pos:] + more
+            pos = 0
+            continue
+
+        raw = m.group()
+        if c == 0x22:
+            yield "string", _decode_string(raw, base + pos), base + pos
+        elif raw in _LITERALS:
+            kind, value = _LITERALS[raw]
+            yield kind, value, base + pos
+        else:
+            yield "number", _decode_number(raw), base + pos
+        pos = m.end()
+
+
+_MAP, _ARRAY = 0, 1
+_KEY_OR_END, _KEY, _COLON, _VALUE, _VALUE_OR_END, _COMMA_OR_END = range(6)
+
+
+def events(fp, chunk_size=CHUNK_SIZE, max_token=MAX_TOKEN):
+    stack = []
+    done = False
+    offset = 0
+
+    for tok, value, offset in tokens(fp, chunk_size, max_token):
+        if done:
+            raise JSONStreamError("extra data after document", offset)
+
+        if stack:
+            frame = stack[-1]
+            kind, state = frame
+
+            if kind == _MAP and state != _VALUE:
+                if state in (_KEY_OR_END, _KEY) and tok == "string":
+                    frame[1] = _COLON
+                    yield "map_key", value, offset
+                    continue
+                if state == _COLON and tok == ":":
+                    frame[1] = _VALUE
+                    continue
+                if state == _COMMA_OR_END and tok == ",":
+                    frame[1] = _KEY
+                    continue
+                if state in (_KEY_OR_END, _COMMA_OR_END) and tok == "}":
+                    stack.pop()
+                    done = not stack
+                    yield "end_map", None, offset
+                    continue
+                raise JSONStreamError(f"unexpected {tok!r} in object", offset)
+
+            if kind == _ARRAY and state != _VALUE:
+                if state in (_VALUE_OR_END, _COMMA_OR_END) and tok == "]":
+                    stack.pop()
+                    done = not stack
+                    yield "end_array", None, offset
+                    continue
+                if state == _COMMA_OR_END:
+                    if tok != ",":
+                        raise JSONStreamError(f"unexpected {tok!r} in array", offset)
+                    frame[1] = _VALUE
+                    continue
+
+            frame[1] = _COMMA_OR_END
+
+        if tok == "{":
+            stack.append([_MAP, _KEY_OR_END])
+            yield "start_map", None, offset
+        elif tok == "[":
+            stack.append([_ARRAY, _VALUE_OR_END])
+            yield "start_array", None, offset
+        elif tok in ("string", "number", "boolean", "null"):
+            done = not stack
+            yield tok, value, offset
+        else:
+            raise JSONStreamError(f"unexpected {tok!r}", offset)
+
+    if stack or not done:
+        raise JSONStreamError("unexpected end of document", offset)
@@ -1,12 +1,16 @@
 import sys
 from PyQt5.QtWidgets import QApplication
 
-from .main_window import run
+from .main_window import run, startup_mark, startup_report
 
 
 def main():
-    app = QApplication(sys.argv)
+    timing = "--startup-timing" in sys.argv
+    app = QApplication([a for a in sys.argv if a != "--startup-timing"])
+    startup_mark("qt")
     window = run()
+    if timing and window is not None:
+        window.first_painted.connect(lambda: print(startup_report(), file=sys.stderr))
     if window is not None:
         window.show()
     sys.exit(app.exec_())
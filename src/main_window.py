@@ -1,8 +1,11 @@
 import os
 import sys
+import threading
+import time
+from collections import OrderedDict
 
-from PyQt5.QtCore import Qt, pyqtSignal, QSize
-from PyQt5.QtGui import QFont, QPixmap, QColor, QIcon
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QTimer
+from PyQt5.QtGui import QFont, QPixmap, QColor, QIcon, QImage
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QStackedWidget, QFrame, QComboBox, QLineEdit,
@@ -11,7 +14,7 @@ from PyQt5.QtWidgets import (
 
 from .game_state import GameState
 from . import word_loader
-from .progress_manager import load_progress, update_progress
+from .progress_manager import ProgressWriter
 
 try:
     from BlurWindow.blurWindow import GlobalBlur
@@ -22,6 +25,30 @@ except Exception:
 BASE_HEIGHT = 720.0
 UI_SCALE = 1.0
 
+# scaled backgrounds kept per (theme, size), and how long a resize has to
+# pause before the fast preview gets replaced by a smooth rescale
+BG_CACHE_SIZE = 4
+RESIZE_SETTLE_MS = 150
+
+
+# (phase, perf_counter) marks from import to first paint; printed by
+# `python -m src.main --startup-timing`
+_startup_t0 = time.perf_counter()
+_startup_phases = []
+
+
+def startup_mark(phase: str) -> None:
+    _startup_phases.append((phase, time.perf_counter()))
+
+
+def startup_report() -> str:
+    lines = []
+    prev = _startup_t0
+    for phase, t in _startup_phases:
+        lines.append(f"{phase:<14}{(t - prev) * 1000:9.1f} ms{(t - _startup_t0) * 1000:10.1f} ms")
+        prev = t
+    return "\n".join(lines)
+
 
 def S(x: float) -> int:
     return max(1, int(x * UI_SCALE))
@@ -31,16 +58,14 @@ def F(x: float) -> int:
     return max(1, int(x * UI_SCALE))
 
 
-def clear_layout(layout) -> None:
-    while layout.count():
-        item = layout.takeAt(0)
-        w = item.widget()
-        if w is not None:
-            w.setParent(None)
-            continue
-        sub = item.layout()
-        if sub is not None:
-            clear_layout(sub)
+def set_flag(widget, name: str, value) -> None:
+    # dynamic property used by a stylesheet selector; re-polish only on change
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
 
 
 def repo_root() -> str:
@@ -56,7 +81,41 @@ def data_path(*parts: str) -> str:
     return os.path.join(repo_root(), "data", *parts)
 
 
-def fit_cover(pix: QPixmap, target: QSize) -> QPixmap:
+def default_words_path() -> str:
+    # Prefer the sharded dataset, then the compiled word pack, as long as
+    # they are at least as new as words.json.
+    src = data_path("words.json")
+    for built, stamp in (
+        (data_path("words"), data_path("words", "manifest.json")),
+        (data_path("words.wmp"), data_path("words.wmp")),
+    ):
+        try:
+            if os.path.getmtime(stamp) >= os.path.getmtime(src):
+                return built
+        except OSError:
+            pass
+    return src
+
+
+_icon_cache = {}
+_icon_cache_scale = None
+
+
+def icon_pixmap(path: str, size: int) -> QPixmap:
+    # icons scaled once per (file, pixel size) and shared by every screen;
+    # sizes come from S(), so a new UI_SCALE drops the whole cache
+    global _icon_cache_scale
+    if _icon_cache_scale != UI_SCALE:
+        _icon_cache.clear()
+        _icon_cache_scale = UI_SCALE
+    key = (path, size)
+    pix = _icon_cache.get(key)
+    if pix is None:
+        pix = _icon_cache[key] = QPixmap(path).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return pix
+
+
+def fit_cover(pix: QPixmap, target: QSize, mode=Qt.SmoothTransformation) -> QPixmap:
     if pix.isNull() or target.width() <= 0 or target.height() <= 0:
         return pix
     tw, th = target.width(), target.height()
@@ -66,7 +125,7 @@ def fit_cover(pix: QPixmap, target: QSize) -> QPixmap:
     scale = max(tw / sw, th / sh)
     nw = int(sw * scale)
     nh = int(sh * scale)
-    scaled = pix.scaled(nw, nh, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    scaled = pix.scaled(nw, nh, Qt.IgnoreAspectRatio, mode)
     x = max(0, (nw - tw) // 2)
     y = max(0, (nh - th) // 2)
     return scaled.copy(x, y, tw, th)
@@ -191,6 +250,32 @@ QPushButton#ThemeButton:hover { background-color: rgba(248, 250, 252, 0.10); }
 """
 
 
+def game_stylesheet() -> str:
+    # GameScreen state styles, built once per screen since they depend on UI_SCALE
+    return f"""
+QPushButton#KeyButton {{ font-size: {F(26)}px; font-weight: 900; }}
+QPushButton#KeyButton[guess="correct"] {{
+    background-color: rgba(191, 219, 254, 0.95);
+    color: rgba(2, 6, 23, 0.95);
+    border-radius: 18px;
+    font-weight: 900;
+}}
+QPushButton#KeyButton[guess="wrong"] {{
+    background-color: rgba(239, 68, 68, 0.90);
+    color: rgba(248, 250, 252, 0.95);
+    border-radius: 18px;
+    font-weight: 900;
+}}
+QLabel#LetterSlot[revealed="true"] {{
+    background-color: rgba(248, 250, 252, 0.92);
+    color: rgba(2, 6, 23, 0.95);
+    border-radius: 22px;
+    font-weight: 900;
+    font-size: {F(30)}px;
+}}
+"""
+
+
 class GlassCard(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -295,8 +380,8 @@ class MainMenuScreen(QWidget):
         self.btn_theme.setFixedSize(S(64), S(64))
         self.btn_theme.setFont(QFont("Segoe UI", F(15), QFont.Bold))
         self.btn_theme.setIconSize(QSize(S(34), S(34)))
-        self._icon_moon = QIcon(assets_path("assets", "icons", "dark.png"))
-        self._icon_sun = QIcon(assets_path("assets", "icons", "light.png"))
+        self._icon_moon = QIcon(icon_pixmap(assets_path("assets", "icons", "dark.png"), S(34)))
+        self._icon_sun = QIcon(icon_pixmap(assets_path("assets", "icons", "light.png"), S(34)))
         self.btn_theme.setIcon(self._icon_moon)
         self.btn_theme.clicked.connect(self._toggle_theme)
         top_row.addWidget(self.btn_theme)
@@ -459,25 +544,20 @@ class GameScreen(QWidget):
         self.life_dots = []
         self._slots_cols = None
 
-        self._style_key_correct = (
-            "background-color: rgba(191, 219, 254, 0.95);"
-            "color: rgba(2, 6, 23, 0.95);"
-            "border-radius: 18px;"
-            "font-weight: 900;"
-        )
-        self._style_key_wrong = (
-            "background-color: rgba(239, 68, 68, 0.90);"
-            "color: rgba(248, 250, 252, 0.95);"
-            "border-radius: 18px;"
-            "font-weight: 900;"
-        )
-        self._style_slot_revealed = (
-            "background-color: rgba(248, 250, 252, 0.92);"
-            "color: rgba(2, 6, 23, 0.95);"
-            "border-radius: 22px;"
-            "font-weight: 900;"
-        )
+        # slot labels and rows are kept across rounds; a round shows the
+        # first len(word) labels and hides the rest
+        self._slot_pool = []
+        self._slot_rows = []
+
+        # what the widgets currently show, so syncs only touch what changed
+        self._shown_mask = 0
+        self._shown_lives = 0
+        self._shown_preview = None
+        self._shown_wrong = None
+        self._shown_score = None
+        self._used_keys = set()
 
+        self.setStyleSheet(game_stylesheet())
         self._build_ui()
 
     def resizeEvent(self, event):
@@ -486,8 +566,7 @@ class GameScreen(QWidget):
             return
         cols = self._compute_slots_per_row()
         if cols != self._slots_cols:
-            self._rebuild_slots()
-            self._sync_slots()
+            self._reflow_slots(cols)
 
     def _compute_slots_per_row(self) -> int:
         slot_w = S(90)
@@ -594,7 +673,6 @@ class GameScreen(QWidget):
                 btn.setObjectName("KeyButton")
                 btn.setFixedSize(S(70), S(70))
                 btn.setFont(key_font)
-                btn.setStyleSheet(f"font-size: {F(26)}px; font-weight: 900;")
                 btn.setCursor(Qt.PointingHandCursor)
                 btn.clicked.connect(lambda checked, l=letter: self.make_guess(l))
                 keyboard.addWidget(btn, r, c0 + i)
@@ -658,49 +736,71 @@ class GameScreen(QWidget):
         self._sync_all()
 
     def _reset_keys(self):
-        for btn in self.key_buttons.values():
+        for letter in self._used_keys:
+            btn = self.key_buttons[letter]
             btn.setEnabled(True)
-            btn.setStyleSheet(f"font-size: {F(26)}px; font-weight: 900;")
+            set_flag(btn, "guess", "")
+        self._used_keys.clear()
 
     def _rebuild_slots(self):
         if self.state is None:
             return
 
-        clear_layout(self.slots_layout)
-        self.slot_labels = []
-
+        n = len(self.state.word)
         cols = self._compute_slots_per_row()
+        if cols != self._slots_cols:
+            self._reflow_slots(cols)
+        while len(self._slot_pool) < n:
+            self._add_slot()
+
+        for i, lbl in enumerate(self._slot_pool):
+            if i >= n:
+                lbl.hide()
+                continue
+            if lbl.property("revealed"):
+                lbl.setText("_")
+                set_flag(lbl, "revealed", False)
+            if lbl.isHidden():
+                lbl.show()
+
+        self.slot_labels = self._slot_pool[:n]
+        self._shown_mask = 0
+
+    def _slot_row(self, r: int):
+        while len(self._slot_rows) <= r:
+            row_layout = QHBoxLayout()
+            row_layout.setContentsMargins(0, 0, 0, 0)
+            row_layout.setSpacing(S(12))
+            row_layout.setAlignment(Qt.AlignCenter)
+            self.slots_layout.addLayout(row_layout)
+            self._slot_rows.append(row_layout)
+        return self._slot_rows[r]
+
+    def _add_slot(self):
+        lbl = QLabel("_")
+        lbl.setObjectName("LetterSlot")
+        lbl.setFixedSize(S(90), S(90))
+        lbl.setAlignment(Qt.AlignCenter)
+        lbl.setFont(QFont("Segoe UI", F(28), QFont.Bold))
+        self._slot_row(len(self._slot_pool) // self._slots_cols).addWidget(lbl)
+        self._slot_pool.append(lbl)
+
+    def _reflow_slots(self, cols: int):
+        # move the pooled labels into rows of `cols`; rows left with only
+        # hidden labels (or none) take no space
         self._slots_cols = cols
-
-        row_layout = None
-        for i, _ch in enumerate(self.state.word):
-            if i % cols == 0:
-                row_layout = QHBoxLayout()
-                row_layout.setContentsMargins(0, 0, 0, 0)
-                row_layout.setSpacing(S(12))
-                row_layout.setAlignment(Qt.AlignCenter)
-                self.slots_layout.addLayout(row_layout)
-
-            lbl = QLabel("_")
-            lbl.setObjectName("LetterSlot")
-            lbl.setFixedSize(S(90), S(90))
-            lbl.setAlignment(Qt.AlignCenter)
-            lbl.setFont(QFont("Segoe UI", F(28), QFont.Bold))
-            row_layout.addWidget(lbl)
-            self.slot_labels.append(lbl)
+        for row_layout in self._slot_rows:
+            while row_layout.count():
+                row_layout.takeAt(0)
+        for i, lbl in enumerate(self._slot_pool):
+            self._slot_row(i // cols).addWidget(lbl)
 
     def _rebuild_lives(self):
-        clear_layout(self.lives_layout)
-        self.life_dots = []
-
-        if not hasattr(self, "_life_pix_full"):
-            self._life_pix_full = QPixmap(assets_path("assets", "icons", "full.png"))
-            self._life_pix_empty = QPixmap(assets_path("assets", "icons", "empty.png"))
-
+        n = self.state.lives_left
         size = S(30)
-        full_scaled = self._life_pix_full.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        full_scaled = icon_pixmap(assets_path("assets", "icons", "full.png"), size)
 
-        for _ in range(self.state.lives_left):
+        while len(self.life_dots) < n:
             dot = QLabel()
             dot.setFixedSize(size, size)
             dot.setAlignment(Qt.AlignCenter)
@@ -708,6 +808,17 @@ class GameScreen(QWidget):
             self.lives_layout.addWidget(dot)
             self.life_dots.append(dot)
 
+        for i, dot in enumerate(self.life_dots):
+            if i >= n:
+                dot.hide()
+                continue
+            if i >= self._shown_lives:
+                dot.setPixmap(full_scaled)
+            if dot.isHidden():
+                dot.show()
+
+        self._shown_lives = n
+        self.lbl_lives.setText(f"Lives: {n}")
 
     def _sync_all(self):
         self._sync_slots()
@@ -718,43 +829,56 @@ class GameScreen(QWidget):
     def _sync_slots(self):
         if self.state is None:
             return
-        for i, ch in enumerate(self.state.word):
+        mask = self.state.revealed_mask
+        changed = mask ^ self._shown_mask
+        while changed:
+            low = changed & -changed
+            i = low.bit_length() - 1
             lbl = self.slot_labels[i]
-            if i in self.state.revealed:
-                lbl.setText(ch)
-                lbl.setStyleSheet(self._style_slot_revealed + f" font-size: {F(30)}px;")
-            else:
-                lbl.setText("_")
-                lbl.setStyleSheet("")
+            revealed = bool(mask & low)
+            lbl.setText(self.state.word[i] if revealed else "_")
+            set_flag(lbl, "revealed", revealed)
+            changed ^= low
+        self._shown_mask = mask
 
     def _sync_lives(self):
         if self.state is None:
             return
 
-        if not hasattr(self, "_life_pix_full"):
-            self._life_pix_full = QPixmap(assets_path("assets", "icons", "full.png"))
-            self._life_pix_empty = QPixmap(assets_path("assets", "icons", "empty.png"))
+        lives = self.state.lives_left
+        if lives == self._shown_lives:
+            return
 
         size = S(30)
-        full_scaled = self._life_pix_full.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        empty_scaled = self._life_pix_empty.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        full_scaled = icon_pixmap(assets_path("assets", "icons", "full.png"), size)
+        empty_scaled = icon_pixmap(assets_path("assets", "icons", "empty.png"), size)
 
-        for i, dot in enumerate(self.life_dots):
-            dot.setPixmap(full_scaled if i < self.state.lives_left else empty_scaled)
+        lo, hi = sorted((lives, self._shown_lives))
+        for i in range(max(0, lo), min(hi, len(self.life_dots))):
+            self.life_dots[i].setPixmap(full_scaled if i < lives else empty_scaled)
+        self._shown_lives = lives
 
-        self.lbl_lives.setText(f"Lives: {self.state.lives_left}")
+        self.lbl_lives.setText(f"Lives: {lives}")
 
     def _sync_preview(self):
         if self.state is None:
             return
-        self.lbl_preview.setText(self.state.masked())
-        wrong = sorted([g for g in self.state.guessed if g not in set(self.state.word)])
-        self.lbl_wrong.setText("Wrong: " + ", ".join(wrong))
+        # masked() and wrong_letters() hand back the same object until they change
+        masked = self.state.masked()
+        if masked is not self._shown_preview:
+            self.lbl_preview.setText(masked)
+            self._shown_preview = masked
+        wrong = self.state.wrong_letters()
+        if wrong is not self._shown_wrong:
+            self.lbl_wrong.setText("Wrong: " + ", ".join(wrong))
+            self._shown_wrong = wrong
 
     def _sync_score(self):
         if self.state is None:
             return
-        self.lbl_score.setText(f"Score: {self.state.score}")
+        if self.state.score != self._shown_score:
+            self.lbl_score.setText(f"Score: {self.state.score}")
+            self._shown_score = self.state.score
 
     def new_word(self):
         if self.category and self.difficulty:
@@ -777,13 +901,14 @@ class GameScreen(QWidget):
 
         result = self.state.guess(letter)
         btn.setDisabled(True)
+        self._used_keys.add(letter)
         if result.get("correct"):
-            btn.setStyleSheet(self._style_key_correct + f" font-size: {F(26)}px;")
+            set_flag(btn, "guess", "correct")
             self.lbl_msg.setText(f"Nice! {letter} is in the word.")
         elif result.get("already_guessed"):
             self.lbl_msg.setText(f"{letter} already guessed.")
         else:
-            btn.setStyleSheet(self._style_key_wrong + f" font-size: {F(26)}px;")
+            set_flag(btn, "guess", "wrong")
             self.lbl_msg.setText(f"Oops! {letter} is not in the word.")
 
         self._sync_all()
@@ -905,19 +1030,35 @@ class ResultScreen(QWidget):
 
 
 class WordMazeWindow(QMainWindow):
-    def __init__(self):
+    first_painted = pyqtSignal()
+
+    def __init__(self, progress_path: str = None):
         super().__init__()
         self.setWindowTitle("Word-Maze")
         self.setStyleSheet(STYLESHEET)
 
         self._dark = False
-        self._bg_path_light = assets_path("assets", "Background", "BACK.jpg")
-        self._bg_path_dark = assets_path("assets", "Background", "BACKdark.jpg")
-        self._bg_pix_light = QPixmap(self._bg_path_light)
-        self._bg_pix_dark = QPixmap(self._bg_path_dark)
+        self._painted = False
+        self._bg_paths = {
+            False: assets_path("assets", "Background", "BACK.jpg"),
+            True: assets_path("assets", "Background", "BACKdark.jpg"),
+        }
+        # the active theme is decoded now, the other one off the UI thread
+        self._bg_pix = {self._dark: QPixmap(self._bg_paths[self._dark])}
+        self._bg_images = {}
+        self._bg_loader = threading.Thread(
+            target=self._decode_background, args=(not self._dark,), name="bg-decode", daemon=True
+        )
+        self._bg_loader.start()
+        self._bg_cache = OrderedDict()
+        self._bg_timer = QTimer(self)
+        self._bg_timer.setSingleShot(True)
+        self._bg_timer.setInterval(RESIZE_SETTLE_MS)
+        self._bg_timer.timeout.connect(self._apply_background)
 
-        self._progress_path = data_path("save_data.json")
-        self._progress = load_progress(self._progress_path)
+        self._progress_path = progress_path or data_path("save_data.json")
+        self._progress_writer = ProgressWriter(self._progress_path)
+        self._progress = self._progress_writer.totals()
 
         self._player = ""
         self._category = ""
@@ -931,20 +1072,15 @@ class WordMazeWindow(QMainWindow):
         self.stack = QStackedWidget(self)
         self.setCentralWidget(self.stack)
 
+        # GameScreen and ResultScreen are built on first use
         self.menu = MainMenuScreen(self._categories_pretty())
-        self.game = GameScreen()
-        self.result = ResultScreen()
+        self._game = None
+        self._result = None
 
         self.stack.addWidget(self.menu)
-        self.stack.addWidget(self.game)
-        self.stack.addWidget(self.result)
 
         self.menu.start_game_signal.connect(self._start_game)
         self.menu.theme_toggled.connect(self.set_dark_mode)
-        self.game.round_finished.connect(self._on_round_finished)
-        self.game.go_menu.connect(self._go_menu)
-        self.result.next_round.connect(self._next_round)
-        self.result.back_menu.connect(self._go_menu)
 
         self.exit_btn = QPushButton("✕", self)
         self.exit_btn.setObjectName("ExitButton")
@@ -956,6 +1092,44 @@ class WordMazeWindow(QMainWindow):
 
         self._apply_background()
 
+    @property
+    def game(self) -> "GameScreen":
+        if self._game is None:
+            self._game = GameScreen()
+            self.stack.addWidget(self._game)
+            self._game.round_finished.connect(self._on_round_finished)
+            self._game.go_menu.connect(self._go_menu)
+            startup_mark("game_screen")
+        return self._game
+
+    @property
+    def result(self) -> "ResultScreen":
+        if self._result is None:
+            self._result = ResultScreen()
+            self.stack.addWidget(self._result)
+            self._result.next_round.connect(self._next_round)
+            self._result.back_menu.connect(self._go_menu)
+            startup_mark("result_screen")
+        return self._result
+
+    def _decode_background(self, dark: bool):
+        # QImage (unlike QPixmap) may be loaded outside the GUI thread
+        self._bg_images[dark] = QImage(self._bg_paths[dark])
+
+    def _bg_source(self, dark: bool) -> QPixmap:
+        pix = self._bg_pix.get(dark)
+        if pix is None:
+            self._bg_loader.join()
+            pix = self._bg_pix[dark] = QPixmap.fromImage(self._bg_images.pop(dark, QImage()))
+        return pix
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            startup_mark("first_paint")
+            self.first_painted.emit()
+
     def _categories_pretty(self):
         cats = word_loader.categories()
         return [c.capitalize() for c in cats]
@@ -975,21 +1149,34 @@ class WordMazeWindow(QMainWindow):
             except Exception:
                 pass
 
-    def _apply_background(self):
-        pix = self._bg_pix_dark if self._dark else self._bg_pix_light
+    def _apply_background(self, smooth: bool = True):
         target = QSize(max(1, self.width()), max(1, self.height()))
-        self.bg.setPixmap(fit_cover(pix, target))
+        key = (self._dark, target.width(), target.height())
+        scaled = self._bg_cache.get(key)
+        if scaled is not None:
+            self._bg_cache.move_to_end(key)
+        else:
+            pix = self._bg_source(self._dark)
+            if not smooth:
+                # mid-drag preview, replaced once the resize settles
+                self.bg.setPixmap(fit_cover(pix, target, Qt.FastTransformation))
+                return
+            scaled = self._bg_cache[key] = fit_cover(pix, target)
+            while len(self._bg_cache) > BG_CACHE_SIZE:
+                self._bg_cache.popitem(last=False)
+        self.bg.setPixmap(scaled)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.bg.setGeometry(0, 0, self.width(), self.height())
-        self._apply_background()
+        self._apply_background(smooth=False)
+        self._bg_timer.start()
         margin = S(18)
         self.exit_btn.move(self.width() - self.exit_btn.width() - margin, margin)
         self.exit_btn.raise_()
 
     def keyPressEvent(self, event):
-        if self.stack.currentWidget() is self.game:
+        if self._game is not None and self.stack.currentWidget() is self._game:
             text = event.text()
             if text and len(text) == 1 and text.isalpha():
                 self.game.handle_physical_key(text)
@@ -1021,7 +1208,7 @@ class WordMazeWindow(QMainWindow):
             self._start_game_after_dialog(self._category, self._difficulty)
             return
 
-        update_progress(self._progress_path, payload)
+        self._progress = self._progress_writer.submit(payload)
         self.result.set_result(payload)
         self.stack.setCurrentWidget(self.result)
 
@@ -1031,6 +1218,10 @@ class WordMazeWindow(QMainWindow):
     def _go_menu(self):
         self.stack.setCurrentWidget(self.menu)
 
+    def closeEvent(self, event):
+        self._progress_writer.close()
+        super().closeEvent(event)
+
 
 def _compute_ui_scale(app: QApplication) -> float:
     screen = app.primaryScreen()
@@ -1049,8 +1240,7 @@ def _compute_ui_scale(app: QApplication) -> float:
     key_cols = 10.0
     base_keyboard_w = key_cols * key_size + (key_cols - 1.0) * key_spacing
 
-    words_all = word_loader.words()
-    max_len = max([len(w) for w in words_all] + [6])
+    max_len = max(word_loader.stats()["max_length"], 6)
     max_len = min(max_len, 10)
     slot_size = 90.0
     slot_spacing = 12.0
@@ -1066,12 +1256,13 @@ def _compute_ui_scale(app: QApplication) -> float:
     return max(0.65, min(scale, 1.6))
 
 
-def run() -> QMainWindow:
+def run(progress_path: str = None, words_path: str = None) -> QMainWindow:
     app = QApplication.instance()
     if app is None:
         raise RuntimeError()
 
-    word_loader.load(data_path("words.json"))
+    word_loader.load(words_path or default_words_path())
+    startup_mark("words")
 
     global UI_SCALE
     UI_SCALE = _compute_ui_scale(app)
@@ -1080,7 +1271,9 @@ def run() -> QMainWindow:
     base_font.setStyleStrategy(QFont.PreferAntialias)
     app.setFont(base_font)
 
-    window = WordMazeWindow()
+    window = WordMazeWindow(progress_path)
+    startup_mark("window")
+    app.aboutToQuit.connect(window._progress_writer.close)
     if GlobalBlur is not None:
         try:
             GlobalBlur(window.winId(), Dark=True, Acrylic=True)
@@ -1088,4 +1281,5 @@ def run() -> QMainWindow:
             pass
 
     window.showFullScreen()
+    startup_mark("shown")
     return window
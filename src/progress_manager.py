@@ -1,5 +1,19 @@
+import atexit
 import json
 import os
+import queue
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
 
 default = {
     "total_score": 0,
@@ -8,28 +22,163 @@ default = {
     "losses": 0
 }
 
+# keep the previous save next to the current one as <path>.bak
+keep_backup = True
+
+
+# how update() guards its read-modify-write against other processes:
+# "exclusive" holds <path>.lock for the whole cycle, "optimistic" reads and
+# applies unlocked and only takes the lock to check nothing changed in
+# between and swap the file in, retrying up to max_retries times. Every
+# locked save bumps the file's "_version", so "nothing changed" is a single
+# comparison; the field never leaves this module.
+lock_mode = "exclusive"
+max_retries = 20
+
+
+def backup_path(path):
+    return path + ".bak"
+
+
+def lock_path(path):
+    return path + ".lock"
+
+
+def pending_path(path):
+    return path + ".pending"
+
+
+def read_pending(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return []
+    return [r for r in data if isinstance(r, dict)]
+
+
+def save_pending(path, results):
+    # rounds a ProgressWriter couldn't hand to its store, kept for the next one
+    save_progress(path, read_pending(path) + list(results), backup=False)
 
-def progress(path):
-    if not os.path.exists(path):
-        save_progress(path, default.copy())
-        return default.copy()
 
+@contextmanager
+def file_lock(path):
+    fd = os.open(lock_path(path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            # LK_LOCK gives up after ~10s, keep waiting
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
+
+
+def _read(path):
     try:
         with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
     except Exception:
-        save_progress(path, default.copy())
-        return default.copy()
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _fsync_dir(folder):
+    # make the rename itself durable (not supported on Windows)
+    try:
+        fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _load(path):
+    # caller holds file_lock(path)
+    for candidate in (path, backup_path(path)):
+        data = _read(candidate)
+        if data is not None:
+            if candidate != path:
+                save_progress(path, data, backup=False)
+            return data
+
+    data = default.copy()
+    save_progress(path, data)
+    return data
+
+
+def _public(data):
+    data.pop("_version", None)
+    return data
+
 
+def progress(path):
+    data = _read(path)
+    if data is None:
+        # restoring from the backup or creating the file writes it
+        with file_lock(path):
+            data = _load(path)
+    return _public(data)
+
+
+def _link_backup(path):
+    # hard-link rather than move the current save aside, so readers in
+    # other processes never see the path missing mid-save
+    tmp = f"{backup_path(path)}.{os.getpid()}.tmp"
+    try:
+        os.remove(tmp)
+    except OSError:
+        pass
+    try:
+        os.link(path, tmp)
+    except OSError:
+        shutil.copy2(path, tmp)
+    os.replace(tmp, backup_path(path))
+
+
+def save_progress(path, data, backup=None):
+    # write a temp file, fsync it, then swap it in; a crash at any point
+    # leaves either the old file, the new one, or the backup intact
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
 
-def save_progress(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+        if (keep_backup if backup is None else backup) and os.path.exists(path):
+            _link_backup(path)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
 
+    _fsync_dir(folder)
 
-def update(path, result):
-    data = progress(path)
 
+def apply(data, result):
     data["total_score"] += result.get("round_score", 0)
     data["games_played"] += 1
 
@@ -38,12 +187,583 @@ def update(path, result):
     else:
         data["losses"] += 1
 
-    save_progress(path, data)
     return data
 
+
+def update(path, result, mode=None):
+    return update_many(path, [result], mode)
+
+
+def update_many(path, results, mode=None):
+    results = list(results)
+    if (mode or lock_mode) == "optimistic":
+        for _ in range(max_retries):
+            data = _read(path)
+            if data is None:
+                # creating or restoring the file has to happen under the lock
+                break
+            version = data.get("_version", 0)
+            for result in results:
+                apply(data, result)
+            data["_version"] = version + 1
+            with file_lock(path):
+                current = _read(path)
+                if current is not None and current.get("_version", 0) == version:
+                    save_progress(path, data)
+                    return _public(data)
+
+    with file_lock(path):
+        data = _load(path)
+        for result in results:
+            apply(data, result)
+        data["_version"] = data.get("_version", 0) + 1
+        save_progress(path, data)
+        return _public(data)
+
+
+def reset(path):
+    with file_lock(path):
+        current = _read(path) or {}
+        save_progress(path, {**default, "_version": current.get("_version", 0) + 1})
+
+class JsonStore:
+    # The plain save file: every update rewrites it.
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        return progress(self.path)
+
+    def update(self, result):
+        return update(self.path, result)
+
+    def update_many(self, results):
+        return update_many(self.path, results)
+
+    def reset(self):
+        reset(self.path)
+
+
+class JournalStore:
+    # The save file becomes a snapshot and every round is appended to
+    # <path>.journal as one compact record, so an update costs a short
+    # append instead of a full rewrite. Totals are the snapshot plus the
+    # journal tail; past max_records/max_bytes the journal is folded back
+    # into the snapshot. Records carry a sequence number and the snapshot
+    # remembers the last one it absorbed ("_seq"), so a crash between
+    # writing the snapshot and truncating the journal can't count a round
+    # twice.
+    #
+    # Several processes can share one journal: appends, compaction and
+    # reads all hold file_lock(path), and under it a store first catches up
+    # with what others wrote. A changed snapshot "_seq" means someone
+    # compacted or reset, so totals are rebuilt from scratch; otherwise
+    # only the journal past the last byte offset read is new, and sequence
+    # numbers continue from the highest one on disk.
+    max_records = 1000
+    max_bytes = 256 * 1024
+
+    def __init__(self, path, max_records=None, max_bytes=None):
+        self.path = path
+        self.journal = path + ".journal"
+        if max_records is not None:
+            self.max_records = max_records
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._totals = None
+        self._base = None
+        self._seq = 0
+        self._records = 0
+        self._bytes = 0
+
+    def _sync(self):
+        # caller holds file_lock(path)
+        snapshot = _read(self.path)
+        if self._totals is None or snapshot is None or snapshot.get("_seq", 0) != self._base:
+            self._replay()
+            return
+        try:
+            size = os.path.getsize(self.journal)
+        except OSError:
+            size = 0
+        if size < self._bytes:
+            self._replay()
+        else:
+            self._read_tail()
+
+    def _replay(self):
+        snapshot = _public(dict(_load(self.path)))
+        self._base = self._seq = int(snapshot.pop("_seq", 0))
+        self._totals = {**default, **snapshot}
+        self._records = 0
+        self._bytes = 0
+        self._read_tail()
+
+    def _read_tail(self):
+        try:
+            with open(self.journal, "rb") as f:
+                f.seek(self._bytes)
+                raw = f.read()
+        except FileNotFoundError:
+            raw = b""
+
+        end = raw.rfind(b"\n") + 1
+        if end != len(raw):
+            # drop a record torn by a crash so the next append starts clean
+            with open(self.journal, "r+b") as f:
+                f.truncate(self._bytes + end)
+
+        for line in raw[:end].splitlines():
+            try:
+                rec = json.loads(line)
+                n = int(rec["n"])
+                result = {"round_score": rec["s"], "won": bool(rec["w"])}
+            except Exception:
+                continue
+            self._records += 1
+            if n <= self._seq:
+                continue
+            apply(self._totals, result)
+            self._seq = n
+        self._bytes += end
+
+    def load(self):
+        with self._lock, file_lock(self.path):
+            self._sync()
+            return dict(self._totals)
+
+    def update(self, result):
+        return self.update_many([result])
+
+    def update_many(self, results):
+        with self._lock, file_lock(self.path):
+            self._sync()
+
+            lines = []
+            for result in results:
+                self._seq += 1
+                rec = {"n": self._seq, "s": result.get("round_score", 0), "w": int(bool(result.get("won")))}
+                lines.append(json.dumps(rec, separators=(",", ":")) + "\n")
+                apply(self._totals, result)
+
+            chunk = "".join(lines).encode("utf-8")
+            with open(self.journal, "ab") as f:
+                f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._records += len(lines)
+            self._bytes += len(chunk)
+            if self._records >= self.max_records or self._bytes >= self.max_bytes:
+                self._compact()
+
+            return dict(self._totals)
+
+    def compact(self):
+        with self._lock, file_lock(self.path):
+            self._sync()
+            self._compact()
+
+    def _compact(self):
+        # every snapshot gets a new "_seq" (gaps are harmless), which is how
+        # other processes notice their journal offset no longer applies
+        self._seq += 1
+        save_progress(self.path, {**self._totals, "_seq": self._seq})
+        with open(self.journal, "wb"):
+            pass
+        self._base = self._seq
+        self._records = 0
+        self._bytes = 0
+
+    def reset(self):
+        with self._lock, file_lock(self.path):
+            self._sync()
+            self._totals = default.copy()
+            self._compact()
+
+
+class SqliteStore:
+    # One row per finished round (player, category, difficulty, word, score,
+    # won, mistakes, timestamp) in a WAL-mode database. Global and per-player
+    # aggregates are kept up to date in the same transaction as the inserts,
+    # so totals, player stats and leaderboards are index lookups rather than
+    # scans. The first time a database is opened, an existing JSON save with
+    # the same stem (save_data.sqlite -> save_data.json) is imported as the
+    # starting totals.
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS rounds (
+        id INTEGER PRIMARY KEY,
+        player TEXT NOT NULL DEFAULT '',
+        category TEXT NOT NULL DEFAULT '',
+        difficulty TEXT NOT NULL DEFAULT '',
+        word TEXT NOT NULL DEFAULT '',
+        score INTEGER NOT NULL,
+        won INTEGER NOT NULL,
+        mistakes INTEGER NOT NULL DEFAULT 0,
+        ts REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS rounds_by_score ON rounds (score DESC);
+    CREATE INDEX IF NOT EXISTS rounds_by_player ON rounds (player, ts);
+
+    CREATE TABLE IF NOT EXISTS players (
+        player TEXT PRIMARY KEY,
+        total_score INTEGER NOT NULL,
+        games_played INTEGER NOT NULL,
+        wins INTEGER NOT NULL,
+        losses INTEGER NOT NULL,
+        best_score INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS players_by_total ON players (total_score DESC);
+
+    CREATE TABLE IF NOT EXISTS totals (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        total_score INTEGER NOT NULL,
+        games_played INTEGER NOT NULL,
+        wins INTEGER NOT NULL,
+        losses INTEGER NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """
+
+    def __init__(self, path, legacy_path=None):
+        self.path = path
+        self.legacy_path = legacy_path or os.path.splitext(path)[0] + ".json"
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+
+        with self._lock:
+            self._db.executescript(self.SCHEMA)
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute("INSERT OR IGNORE INTO totals VALUES (0, 0, 0, 0, 0)")
+                imported = self._db.execute("SELECT 1 FROM meta WHERE key = 'imported'").fetchone()
+                if imported is None:
+                    self._import_legacy()
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _import_legacy(self):
+        legacy = _read(self.legacy_path) or _read(backup_path(self.legacy_path))
+        if legacy is not None:
+            data = {**default, **legacy}
+            self._db.execute(
+                "UPDATE totals SET total_score = total_score + ?, games_played = games_played + ?,"
+                " wins = wins + ?, losses = losses + ? WHERE id = 0",
+                (int(data["total_score"]), int(data["games_played"]), int(data["wins"]), int(data["losses"])),
+            )
+        self._db.execute(
+            "INSERT INTO meta VALUES ('imported', ?)",
+            (self.legacy_path if legacy is not None else "",),
+        )
+
+    def _totals(self):
+        row = self._db.execute(
+            "SELECT total_score, games_played, wins, losses FROM totals WHERE id = 0"
+        ).fetchone()
+        return dict(row)
+
+    def load(self):
+        with self._lock:
+            return self._totals()
+
+    def update(self, result):
+        return self.update_many([result])
+
+    def update_many(self, results):
+        now = time.time()
+        rows = []
+        players = {}
+        added = dict.fromkeys(default, 0)
+
+        for result in results:
+            score = int(result.get("round_score", 0))
+            won = 1 if result.get("won") else 0
+            player = str(result.get("player") or "")
+            rows.append((
+                player,
+                str(result.get("category") or ""),
+                str(result.get("difficulty") or ""),
+                str(result.get("word") or ""),
+                score,
+                won,
+                int(result.get("mistakes", 0)),
+                now,
+            ))
+            apply(added, result)
+
+            agg = players.setdefault(player, [0, 0, 0, 0, score])
+            agg[0] += score
+            agg[1] += 1
+            agg[2] += won
+            agg[3] += 1 - won
+            agg[4] = max(agg[4], score)
+
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.executemany(
+                    "INSERT INTO rounds (player, category, difficulty, word, score, won, mistakes, ts)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._db.executemany(
+                    "INSERT INTO players VALUES (?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT (player) DO UPDATE SET"
+                    " total_score = total_score + excluded.total_score,"
+                    " games_played = games_played + excluded.games_played,"
+                    " wins = wins + excluded.wins,"
+                    " losses = losses + excluded.losses,"
+                    " best_score = max(best_score, excluded.best_score)",
+                    [(player, *agg) for player, agg in players.items()],
+                )
+                self._db.execute(
+                    "UPDATE totals SET total_score = total_score + ?, games_played = games_played + ?,"
+                    " wins = wins + ?, losses = losses + ? WHERE id = 0",
+                    (added["total_score"], added["games_played"], added["wins"], added["losses"]),
+                )
+                totals = self._totals()
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return totals
+
+    def reset(self):
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute("DELETE FROM rounds")
+                self._db.execute("DELETE FROM players")
+                self._db.execute("UPDATE totals SET total_score = 0, games_played = 0, wins = 0, losses = 0")
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def leaderboard(self, limit=10):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT * FROM players WHERE player != '' ORDER BY total_score DESC LIMIT ?",
+                (int(limit),),
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def top_rounds(self, limit=10):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT player, category, difficulty, word, score, won, mistakes, ts"
+                " FROM rounds ORDER BY score DESC LIMIT ?",
+                (int(limit),),
+            ).fetchall()
+        return [dict(r, won=bool(r["won"])) for r in rows]
+
+    def player_stats(self, player):
+        with self._lock:
+            row = self._db.execute("SELECT * FROM players WHERE player = ?", (player,)).fetchone()
+        if row is None:
+            return {"player": player, **default, "best_score": 0}
+        return dict(row)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+backends = {
+    "json": JsonStore,
+    "journal": JournalStore,
+    "sqlite": SqliteStore,
+}
+default_backend = "json"
+sqlite_suffixes = (".sqlite", ".sqlite3", ".db")
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def open_store(path, backend=None):
+    # one store per (backend, file) so stateful backends keep their cache
+    if backend is None:
+        backend = "sqlite" if path.lower().endswith(sqlite_suffixes) else default_backend
+    key = (backend, os.path.abspath(path))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = backends[backend](path)
+    return store
+
+
+def load_progress(path, backend=None):
+    return open_store(path, backend).load()
+
+
+def update_progress(path, result, backend=None):
+    return open_store(path, backend).update(result)
+
+
+def update_progress_many(path, results, backend=None):
+    store = open_store(path, backend)
+    results = list(results)
+    if not results:
+        return store.load()
+    return store.update_many(results)
+
+
 # when the game ended
-def reset_progress(path):
-    save_progress(path, default.copy())
+def reset_progress(path, backend=None):
+    open_store(path, backend).reset()
+
+
+def leaderboard(path, limit=10):
+    return open_store(path, "sqlite").leaderboard(limit)
+
+
+def top_rounds(path, limit=10):
+    return open_store(path, "sqlite").top_rounds(limit)
+
+
+def player_stats(path, player):
+    return open_store(path, "sqlite").player_stats(player)
+
+
+class ProgressWriter:
+    # Write-behind persistence for the UI: submit() folds a result into the
+    # in-memory totals and returns them at once, and a background thread
+    # writes pending results to the store in coalesced batches every
+    # `interval` seconds. flush() waits for everything submitted so far;
+    # close() (also run at interpreter exit) flushes and stops the thread.
+    # A failed write is retried every `interval` and with the next batch
+    # rather than dropped, and flush() raises while results are unwritten.
+    # Whatever close() can't write goes to <path>.pending, which the next
+    # writer for the same file replays into the store when it starts.
+    _STOP = object()
+    _FLUSH = object()
+
+    def __init__(self, path, backend=None, interval=1.0, max_pending=1024):
+        self.store = open_store(path, backend)
+        self.pending = pending_path(path)
+        self.interval = interval
+        self.error = None
+
+        self._lock = threading.Lock()
+        self._recover()
+        self._totals = self.store.load()
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._wake = threading.Event()
+        self._retry = []
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _recover(self):
+        # claim the file by renaming it, so only one writer replays it
+        claim = f"{self.pending}.{os.getpid()}"
+        try:
+            os.replace(self.pending, claim)
+        except OSError:
+            return
+        try:
+            results = read_pending(claim)
+            if results:
+                self.store.update_many(results)
+        except Exception as exc:
+            self.error = exc
+            os.replace(claim, self.pending)
+        else:
+            os.remove(claim)
+
+    def totals(self):
+        with self._lock:
+            return dict(self._totals)
+
+    def submit(self, result):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("progress writer is closed")
+            apply(self._totals, result)
+            totals = dict(self._totals)
+        self._queue.put(dict(result))
+        return totals
+
+    def flush(self):
+        with self._lock:
+            if self._closed:
+                return
+        self._queue.put(self._FLUSH)
+        self._wake.set()
+        self._queue.join()
+        unsaved = len(self._retry)
+        if unsaved:
+            raise RuntimeError(f"{unsaved} progress result(s) not saved") from self.error
+
+    def close(self):
+        # returns None when everything reached the store, otherwise the
+        # store's error (the rest is in self.pending); raises only if even
+        # the pending file can't be written
+        with self._lock:
+            if self._closed:
+                return None
+            self._closed = True
+        self._queue.put(self._STOP)
+        self._wake.set()
+        self._thread.join()
+        atexit.unregister(self.close)
+
+        if not self._retry:
+            return None
+        save_pending(self.pending, self._retry)
+        self._retry = []
+        return self.error
+
+    def _run(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=self.interval if self._retry else None)
+            except queue.Empty:
+                # nothing new, but a failed batch is waiting
+                self._write(self._retry)
+                continue
+            if first is not self._STOP and first is not self._FLUSH:
+                # give more results a chance to pile up before writing
+                self._wake.wait(self.interval)
+            self._wake.clear()
+
+            batch = [first]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is self._STOP for item in batch)
+            results = self._retry + [item for item in batch if isinstance(item, dict)]
+            if results:
+                self._write(results, final=stop)
+
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
 
-load_progress = progress
-update_progress = update
+    def _write(self, results, final=False):
+        attempts = 3 if final else 1
+        for _ in range(attempts):
+            try:
+                self.store.update_many(results)
+                self.error = None
+                self._retry = []
+                return
+            except Exception as exc:
+                self.error = exc
+        self._retry = results
@@ -0,0 +1,318 @@
+import os
+import random
+from collections import deque
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+
+from .game_state import GameState
+from .word_loader import WordLoader
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Batch replay of finished rounds with GameState semantics, minus the
+# GameState: each round is a handful of ints (letter bitmasks, life and
+# score counters). With NumPy the whole batch advances one guess column at
+# a time; without it every round runs through the same arithmetic in plain
+# Python. The NumPy engine only pays off once its setup is spread over a few
+# thousand rounds (core_bench's simulation cases), so by default smaller
+# batches stay in Python. Both paths draw hint letters from `rng` in round order, exactly
+# like replaying the rounds one by one through project.simulate_round.
+
+LIVES = GameState.lives
+HINT_COST = GameState.hint_cost
+CORRECT_LETTER = GameState.correct_letter
+PERFECT_WIN = GameState.perfect_win
+
+MAX_CODES = 63
+CHUNK_SIZE = 2048
+VECTORIZE_MIN = 4096
+
+
+def _guess_key(g):
+    # The letter GameState.guess() would record, or None for invalid input.
+    g = str(g)
+    if not g or len(g) != 1 or not g.isalpha():
+        return None
+    return g.upper()
+
+
+def _prepare(word):
+    word = str(word).upper()
+    if not word:
+        raise ValueError()
+    counts = {}
+    for ch in word:
+        if ch.isalpha():
+            counts[ch] = counts.get(ch, 0) + 1
+    return word, counts
+
+
+def _hidden(word, bits, revealed):
+    return [i for i, ch in enumerate(word) if ch in bits and not revealed & bits[ch]]
+
+
+def play(word, guesses, use_hint=False, rng=random):
+    word, counts = _prepare(word)
+    bits = {ch: 1 << i for i, ch in enumerate(counts)}
+    need = (1 << len(counts)) - 1
+
+    revealed = 0
+    seen = set()
+    life = LIVES
+    score = 0
+    mistakes = 0
+    hinted = False
+
+    for g in guesses:
+        if revealed == need or life <= 0:
+            break
+
+        key = _guess_key(g)
+        if key is None or key in seen:
+            continue
+        seen.add(key)
+
+        bit = bits.get(key)
+        if bit is None:
+            life -= 1
+            mistakes += 1
+            continue
+
+        revealed |= bit
+        score += counts[key] * CORRECT_LETTER
+
+        if use_hint and not hinted:
+            hinted = True
+            if revealed != need and score >= HINT_COST:
+                ch = word[rng.choice(_hidden(word, bits, revealed))]
+                revealed |= bits[ch]
+                score -= HINT_COST
+
+    won = revealed == need
+    bonus = PERFECT_WIN if won and mistakes == 0 else 0
+    return score + bonus, won, bonus, mistakes
+
+
+def simulate_python(rounds, use_hint=False, rng=random):
+    scores, wons, bonuses, mistakes = [], [], [], []
+    for word, guesses in rounds:
+        s, w, b, m = play(word, guesses, use_hint, rng)
+        scores.append(s)
+        wons.append(w)
+        bonuses.append(b)
+        mistakes.append(m)
+    return scores, wons, bonuses, mistakes
+
+
+def _encode(rows):
+    # Every guess as a letter code in one (rounds x longest) array, -1 where
+    # GameState would ignore it. The guesses of the whole batch are joined
+    # into one string and mapped through a table indexed by code point, so
+    # nothing runs per guess in Python. None when a guess isn't a string
+    # (those go through play()).
+    flat = list(chain.from_iterable(rows))
+    try:
+        joined = "".join(flat)
+    except TypeError:
+        return None
+    if len(joined) != len(flat) or "" in flat:
+        # multi-letter or empty guesses are ignored, keep one char per slot
+        joined = "".join(g if len(g) == 1 else "\x00" for g in flat)
+
+    chars = np.frombuffer(joined.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    codes = {}
+    table = np.full(int(chars.max()) + 1 if len(chars) else 1, -1, dtype=np.int64)
+    for cp in np.flatnonzero(np.bincount(chars)).tolist():
+        key = _guess_key(chr(cp))
+        if key is not None:
+            table[cp] = codes.setdefault(key, len(codes))
+
+    lengths = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+    width = int(lengths.max()) if len(rows) else 0
+    guess = np.full((len(rows), width), -1, dtype=np.int64)
+    guess[np.arange(width) < lengths[:, None]] = table[chars]
+    return guess, codes
+
+
+def simulate_numpy(rounds, use_hint=False, rng=random):
+    words = []
+    rows = []
+    for word, guesses in rounds:
+        words.append(word)
+        rows.append(guesses if isinstance(guesses, (list, tuple)) else list(guesses))
+
+    encoded = _encode(rows)
+    if encoded is None:
+        return simulate_python(zip(words, rows), use_hint, rng)
+    guess, codes = encoded
+
+    word_ids = {}
+    ids = [word_ids.setdefault(word, len(word_ids)) for word in words]
+    unique = [_prepare(word) for word in word_ids]
+    for _, letter_counts in unique:
+        for ch in letter_counts:
+            codes.setdefault(ch, len(codes))
+
+    if len(codes) > MAX_CODES:
+        return simulate_python(zip(words, rows), use_hint, rng)
+
+    n, width = guess.shape
+
+    # per distinct word: letter counts by code and the mask of letters to find
+    word_counts = np.zeros((max(1, len(unique)), max(1, len(codes))), dtype=np.int64)
+    word_need = np.zeros(max(1, len(unique)), dtype=np.int64)
+    for wid, (_, letter_counts) in enumerate(unique):
+        mask = 0
+        for ch, c in letter_counts.items():
+            word_counts[wid, codes[ch]] = c
+            mask |= 1 << codes[ch]
+        word_need[wid] = mask
+
+    word_of = np.array(ids, dtype=np.int64)
+    need = word_need[word_of]
+
+    guessed = np.zeros(n, dtype=np.int64)
+    revealed = np.zeros(n, dtype=np.int64)
+    life = np.full(n, LIVES, dtype=np.int64)
+    score = np.zeros(n, dtype=np.int64)
+    mistakes = np.zeros(n, dtype=np.int64)
+
+    def advance(t, allowed):
+        code = guess[:, t]
+        valid = (code >= 0) & allowed & ((revealed & need) != need) & (life > 0)
+        bit = np.where(valid, np.left_shift(1, np.maximum(code, 0)), 0)
+        new = (guessed & bit) == 0
+        new &= valid
+        guessed[:] |= np.where(new, bit, 0)
+        hit = new & ((need & bit) != 0)
+        miss = new & ~hit
+        revealed[:] |= np.where(hit, bit, 0)
+        score[:] += np.where(hit, word_counts[word_of, np.maximum(code, 0)] * CORRECT_LETTER, 0)
+        life[:] -= miss
+        mistakes[:] += miss
+        return hit
+
+    if not use_hint:
+        everyone = np.ones(n, dtype=bool)
+        for t in range(width):
+            advance(t, everyone)
+    else:
+        # Play every round up to its first correct guess, take the hints in
+        # round order (that's where the rng is consumed), then resume.
+        pending = np.ones(n, dtype=bool)
+        resume = np.full(n, width, dtype=np.int64)
+        for t in range(width):
+            hit = advance(t, pending)
+            resume[hit] = t + 1
+            pending &= ~hit
+
+        eligible = ~pending & ((revealed & need) != need) & (score >= HINT_COST)
+        word_bits = {}
+        for r in np.flatnonzero(eligible):
+            word, letter_counts = unique[ids[r]]
+            bits = word_bits.get(ids[r])
+            if bits is None:
+                bits = word_bits[ids[r]] = {ch: 1 << codes[ch] for ch in letter_counts}
+            ch = word[rng.choice(_hidden(word, bits, int(revealed[r])))]
+            revealed[r] |= bits[ch]
+            score[r] -= HINT_COST
+
+        for t in range(width):
+            advance(t, ~pending & (resume <= t))
+
+    won = (revealed & need) == need
+    bonus = np.where(won & (mistakes == 0), PERFECT_WIN, 0)
+    return score + bonus, won, bonus, mistakes
+
+
+def simulate(rounds, use_hint=False, rng=random, vectorize=None):
+    if vectorize is None:
+        if not isinstance(rounds, (list, tuple)):
+            rounds = list(rounds)
+        vectorize = np is not None and len(rounds) >= VECTORIZE_MIN
+    if vectorize:
+        if np is None:
+            raise RuntimeError("NumPy is not installed")
+        return simulate_numpy(rounds, use_hint, rng)
+    return simulate_python(rounds, use_hint, rng)
+
+
+# Parallel replay. Jobs are cut into fixed-size chunks and every chunk gets
+# its own rng seeded from (seed, chunk start), so the results depend on the
+# seed and chunk size but never on how many workers ran them. A job whose
+# word is None draws one from the worker's dataset, loaded once per process
+# by the pool initializer.
+
+_worker_loader = None
+
+
+def _init_worker(source):
+    global _worker_loader
+    _worker_loader = WordLoader()
+    if source is not None:
+        _worker_loader.load(source)
+
+
+def _run_chunk(start, jobs, seed, use_hint, category, difficulty, vectorize, loader=None):
+    loader = loader or _worker_loader
+    rng = random.Random(f"{seed}:{start}")
+
+    rounds = []
+    for word, guesses in jobs:
+        if word is None:
+            pool = loader.words(category, difficulty)
+            if not pool:
+                raise ValueError("no words match the given filters")
+            word = pool[rng.randrange(len(pool))]
+        rounds.append((word, guesses))
+
+    return tuple(
+        column.tolist() if hasattr(column, "tolist") else column
+        for column in simulate(rounds, use_hint, rng, vectorize)
+    )
+
+
+def _chunks(jobs, size):
+    chunk = []
+    start = 0
+    for word, guesses in jobs:
+        chunk.append((word, list(guesses)))
+        if len(chunk) >= size:
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def simulate_parallel(jobs, source=None, workers=None, chunk_size=CHUNK_SIZE, seed=0,
+                      use_hint=False, category=None, difficulty=None, vectorize=None):
+    # Yields one (round_score, won, bonus, mistakes) tuple of columns per
+    # chunk, in job order.
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, int(chunk_size))
+    args = (seed, use_hint, category, difficulty, vectorize)
+
+    if workers <= 1:
+        loader = WordLoader()
+        if source is not None:
+            loader.load(source)
+        for start, chunk in _chunks(jobs, chunk_size):
+            yield _run_chunk(start, chunk, *args, loader=loader)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(source,)) as pool:
+        pending = deque()
+        try:
+            for start, chunk in _chunks(jobs, chunk_size):
+                pending.append(pool.submit(_run_chunk, start, chunk, *args))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,305 @@
+import math
+import threading
+from array import array
+from collections import OrderedDict
+
+from . import word_loader
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Candidate search over a word pool with int bitsets. Words are grouped by
+# length (a round's slot count fixes the length), and every length gets a
+# table where bit k stands for the k-th word of that length:
+#
+#   has[L]        words containing letter L
+#   at[(i, ch)]   words with ch at position i
+#   other[i]      words with a non-letter (space, hyphen...) at position i
+#
+# Tables are built the first time a length is asked for (column by column
+# with NumPy when it is installed). A Solver follows one GameState and
+# narrows its candidate bitset with only the constraints that are new since
+# the last update; ranking a letter splits the candidates by where the
+# letter would show up, which gives the exact information (entropy) and
+# expected elimination of guessing it.
+#
+# Every step of a split costs as much as the table is wide, however few
+# candidates are left, so once they drop to REPACK_MAX and to a quarter of
+# the table the Solver re-indexes just those words in a table of its own.
+# Rankings over more candidates than that are remembered per word index
+# (the opening position of every round of a given length is the same).
+
+MAX_INDEXES = 8
+REPACK_MAX = 20000
+MAX_RANKINGS = 64
+
+
+class LengthTable:
+    __slots__ = ("length", "ids", "all", "has", "at", "other")
+
+    def __init__(self, words, ids, length):
+        self.length = length
+        self.ids = ids
+        self.all = (1 << len(ids)) - 1
+
+        if np is not None and len(ids) >= 1024:
+            self.at = _columns(words, ids, length)
+            self.has = {}
+            for (i, ch), bits in self.at.items():
+                if ch.isalpha():
+                    self.has[ch] = self.has.get(ch, 0) | bits
+        else:
+            self.has, self.at = _scan(words, ids)
+
+        self.other = {}
+        for (i, ch), bits in self.at.items():
+            if not ch.isalpha():
+                self.other[i] = self.other.get(i, 0) | bits
+
+
+def _scan(words, ids):
+    size = (len(ids) + 7) // 8
+    has = {}
+    at = {}
+    for k, idx in enumerate(ids):
+        byte, bit = k >> 3, 1 << (k & 7)
+        word = words[idx].upper()
+        for i, ch in enumerate(word):
+            bits = at.get((i, ch))
+            if bits is None:
+                bits = at[(i, ch)] = bytearray(size)
+            bits[byte] |= bit
+        for ch in set(word):
+            if ch.isalpha():
+                bits = has.get(ch)
+                if bits is None:
+                    bits = has[ch] = bytearray(size)
+                bits[byte] |= bit
+    return _to_ints(has), _to_ints(at)
+
+
+def _columns(words, ids, length):
+    # the words as a (words x length) array of code points; one bitset per
+    # distinct character of each column
+    text = "".join([words[i] for i in ids]).upper()
+    codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32).reshape(len(ids), length)
+    at = {}
+    for i in range(length):
+        col = codes[:, i]
+        for cp in np.flatnonzero(np.bincount(col)).tolist():
+            packed = np.packbits(col == cp, bitorder="little")
+            at[(i, chr(cp))] = int.from_bytes(packed.tobytes(), "little")
+    return at
+
+
+def _to_ints(maps):
+    out = {}
+    while maps:
+        key, bits = maps.popitem()
+        out[key] = int.from_bytes(bits, "little")
+    return out
+
+
+def iter_bits(bits):
+    # set bit positions, lowest first, without repeated big-int shifts
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for byte_no, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            yield (byte_no << 3) + low.bit_length() - 1
+            byte ^= low
+
+
+class WordIndex:
+    def __init__(self, words):
+        self.words = words
+        self._lock = threading.Lock()
+        self._ids = None
+        self._tables = {}
+        self._rankings = OrderedDict()
+
+    def table(self, length):
+        with self._lock:
+            table = self._tables.get(length)
+            if table is None:
+                if self._ids is None:
+                    self._ids = {}
+                    for idx, word in enumerate(self.words):
+                        n = len(word.upper())
+                        ids = self._ids.get(n)
+                        if ids is None:
+                            ids = self._ids[n] = array("I")
+                        ids.append(idx)
+                table = self._tables[length] = LengthTable(self.words, self._ids.get(length, array("I")), length)
+            return table
+
+    def words_of(self, table, bits, limit=None):
+        out = []
+        for k in iter_bits(bits):
+            if limit is not None and len(out) >= limit:
+                break
+            out.append(self.words[table.ids[k]])
+        return out
+
+    def ranking(self, key):
+        with self._lock:
+            ranked = self._rankings.get(key)
+            if ranked is not None:
+                self._rankings.move_to_end(key)
+            return ranked
+
+    def remember(self, key, ranked):
+        with self._lock:
+            self._rankings[key] = ranked
+            if len(self._rankings) > MAX_RANKINGS:
+                self._rankings.popitem(last=False)
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def index_for(category=None, difficulty=None, loader=None):
+    # one index per pool; a reload hands out new pool objects, which
+    # retires the old entry
+    loader = loader or word_loader.default_loader()
+    pool = loader.words(category, difficulty)
+    key = (id(loader), category or None, difficulty or None)
+    with _indexes_lock:
+        entry = _indexes.get(key)
+        if entry is not None and entry.words is pool:
+            return entry
+        if len(_indexes) >= MAX_INDEXES:
+            _indexes.pop(next(iter(_indexes)))
+        entry = _indexes[key] = WordIndex(pool)
+        return entry
+
+
+class Solver:
+    def __init__(self, state, category=None, difficulty=None, index=None, loader=None):
+        self.state = state
+        self.index = index or index_for(category, difficulty, loader)
+        self.table = self.index.table(len(state.word))
+        self.bits = self.table.all
+        self._alphabet = sorted(self.table.has)
+        self._revealed = 0
+        self._letters = set()
+
+        # non-letters are shown from the start, so no candidate can have one
+        # where the target is still hidden
+        mask = state.revealed_mask
+        for i, bits in self.table.other.items():
+            if not mask >> i & 1:
+                self.bits &= ~bits
+        self.update()
+
+    def update(self):
+        state = self.state
+        table = self.table
+        word = state.word
+        bits = self.bits
+
+        mask = state.revealed_mask
+        new = mask & ~self._revealed
+        known = set(state.guessed)
+        while new:
+            low = new & -new
+            i = low.bit_length() - 1
+            bits &= table.at.get((i, word[i]), 0)
+            new ^= low
+        self._revealed = mask
+
+        for i in range(len(word)):
+            if mask >> i & 1 and word[i].isalpha():
+                known.add(word[i])
+
+        hidden = [i for i in range(len(word)) if not mask >> i & 1]
+        for letter in known - self._letters:
+            if letter in word:
+                # a letter that is in the word shows up everywhere it occurs
+                for i in hidden:
+                    bits &= ~table.at.get((i, letter), 0)
+            else:
+                bits &= ~table.has.get(letter, 0)
+        self._letters |= known
+
+        count = bits.bit_count()
+        if count <= REPACK_MAX and count * 4 <= len(table.ids):
+            ids = array("I", [table.ids[k] for k in iter_bits(bits)])
+            self.table = table = LengthTable(self.index.words, ids, table.length)
+            bits = table.all
+
+        self.bits = bits
+        return count
+
+    def count(self):
+        return self.bits.bit_count()
+
+    def candidates(self, limit=None):
+        return self.index.words_of(self.table, self.bits, limit)
+
+    def split(self, letter):
+        # candidate groups by the hidden positions `letter` would fill
+        bits = self.bits
+        table = self.table
+        present = bits & table.has.get(letter, 0)
+        groups = [present] if present else []
+        for i in range(table.length):
+            if not groups or self._revealed >> i & 1:
+                continue
+            at = table.at.get((i, letter), 0)
+            refined = []
+            for g in groups:
+                hit = g & at
+                if hit:
+                    refined.append(hit)
+                    if hit != g:
+                        refined.append(g & ~at)
+                else:
+                    refined.append(g)
+            groups = refined
+        absent = bits & ~present
+        sizes = [g.bit_count() for g in groups]
+        if absent:
+            sizes.append(absent.bit_count())
+        return sizes
+
+    def rank_letters(self, by="information"):
+        # [(letter, score)], best first; "information" is the expected bits
+        # learned, "elimination" the expected number of candidates ruled out
+        total = self.count()
+        if not total:
+            return []
+
+        key = None
+        if total > REPACK_MAX:
+            word = self.state.word
+            shown = "".join(word[i] for i in range(len(word)) if self._revealed >> i & 1)
+            key = (len(word), self._revealed, shown, frozenset(self._letters), by)
+            ranked = self.index.ranking(key)
+            if ranked is not None:
+                return list(ranked)
+
+        ranked = []
+        for letter in self._alphabet:
+            if letter in self._letters:
+                continue
+            sizes = self.split(letter)
+            if by == "information":
+                score = sum(n / total * math.log2(total / n) for n in sizes)
+            elif by == "elimination":
+                score = total - sum(n * n for n in sizes) / total
+            else:
+                raise ValueError(f"unknown ranking {by!r}")
+            ranked.append((letter, score))
+
+        ranked.sort(key=lambda item: -item[1])
+        if key is not None:
+            self.index.remember(key, tuple(ranked))
+        return ranked
+
+    def best_letter(self, by="information"):
+        ranked = self.rank_letters(by)
+        return ranked[0][0] if ranked else None
@@ -1,64 +1,174 @@
 import json
 import random
+import threading
+from types import MappingProxyType
+
+from . import word_pack
+from . import word_shards
+from .word_stats import dataset_stats
+
+
+class Deck:
+    # Lazily shuffled deck of pool positions (Fisher-Yates, one step per
+    # draw). Only swapped slots are stored, so creating a deck is O(1) and
+    # every draw is O(1); nothing repeats until the pool runs out, then the
+    # deck reshuffles.
+    __slots__ = ("size", "pos", "swaps")
+
+    def __init__(self, size):
+        self.size = size
+        self.pos = 0
+        self.swaps = {}
+
+    def draw(self, rng=random):
+        if self.pos >= self.size:
+            self.pos = 0
+            self.swaps.clear()
+
+        i = self.pos
+        j = rng.randrange(i, self.size)
+        top = self.swaps.pop(i, i)
+        if j == i:
+            picked = top
+        else:
+            picked = self.swaps.get(j, j)
+            self.swaps[j] = top
+
+        self.pos += 1
+        return picked
+
+
+def build_index(obj):
+    # (category, difficulty) -> tuple of words; None in either slot is the
+    # "all categories" / "all difficulties" rollup.
+    idx = {}
+    by_diff = {}
+    everything = []
+
+    for cat, diffs in obj.items():
+        cat_words = []
+        for diff, ws in diffs.items():
+            pool = tuple(ws)
+            idx[(cat, diff)] = pool
+            cat_words.extend(pool)
+            by_diff.setdefault(diff, []).extend(pool)
 
-data = {}
-used = set()
+        idx[(cat, None)] = tuple(cat_words)
+        everything.extend(cat_words)
 
+    for diff, ws in by_diff.items():
+        idx[(None, diff)] = tuple(ws)
 
-def load(file_path):
-    global data, used
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    idx[(None, None)] = tuple(everything)
+    return MappingProxyType(idx)
 
-    used = set()
 
+class WordLoader:
+    # Owns one dataset, its index, its word_stats summary and a no-repeat
+    # history. The dataset, index and stats are fixed once loaded; the decks
+    # are guarded by a lock, and session() hands out loaders that share the
+    # dataset but keep their own history (and lock), so independent game
+    # sessions never contend.
+    def __init__(self, obj=None):
+        self._lock = threading.Lock()
+        self.data = {}
+        self.index = MappingProxyType({})
+        self.stats = dataset_stats({})
+        self._samplers = {}
 
-def load_data(obj):
-    global data, used
-    data = obj
-    used = set()
+        if obj is not None:
+            self.load_data(obj)
 
+    def load(self, file_path):
+        if word_shards.is_shards(file_path):
+            shards = word_shards.ShardedDataset(file_path)
+            self._install(shards.data, shards.index, shards.stats)
+            return
 
-def categories():
-    return list(data.keys())
+        if word_pack.is_pack(file_path):
+            pack = word_pack.WordPack(file_path)
+            self._install(pack.data, pack.index, pack.stats)
+            return
 
+        with open(file_path, "r", encoding="utf-8") as f:
+            obj = json.load(f)
 
-def words(category=None, difficulty=None):
-    result = []
-    for cat in data:
-        if category and cat != category:
-            continue
+        self.load_data(obj)
+
+    def load_data(self, obj):
+        self._install(obj, build_index(obj), dataset_stats(obj))
+
+    def _install(self, obj, idx, stats):
+        with self._lock:
+            self.data = obj
+            self.index = idx
+            self.stats = stats
+            self._samplers = {}
+
+    def session(self):
+        other = WordLoader()
+        other.data = self.data
+        other.index = self.index
+        other.stats = self.stats
+        return other
+
+    def categories(self):
+        return list(self.data.keys())
+
+    def words(self, category=None, difficulty=None):
+        return self.index.get((category or None, difficulty or None), ())
+
+    def random_word(self, category=None, difficulty=None, rng=None):
+        key = (category or None, difficulty or None)
+
+        with self._lock:
+            if not self.data:
+                raise RuntimeError()
+
+            pool = self.index.get(key, ())
+            if not pool:
+                raise ValueError()
+
+            deck = self._samplers.get(key)
+            if deck is None:
+                deck = self._samplers[key] = Deck(len(pool))
 
-        for diff in data[cat]:
-            if difficulty and diff != difficulty:
-                continue
+            return pool[deck.draw(rng or random)]
 
-            for w in data[cat][diff]:
-                result.append(w)
 
-    return result
+_default = WordLoader()
 
 
-def random_word(category=None, difficulty=None):
-    global used
+def __getattr__(name):
+    # `data` and `index` used to be module globals; keep reading them working.
+    if name in ("data", "index"):
+        return getattr(_default, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    if not data:
-        raise RuntimeError()
 
-    all_words = words(category, difficulty)
-    if not all_words:
-        raise ValueError()
+def default_loader():
+    return _default
+
+
+def load(file_path):
+    _default.load(file_path)
+
+
+def load_data(obj):
+    _default.load_data(obj)
+
+
+def categories():
+    return _default.categories()
+
+
+def words(category=None, difficulty=None):
+    return _default.words(category, difficulty)
 
-    available = []
-    for w in all_words:
-        if w not in used:
-            available.append(w)
 
-    if not available:
-        used.clear()
-        available = all_words
+def stats():
+    return _default.stats
 
-    word = random.choice(available)
-    used.add(word)
 
-    return word
+def random_word(category=None, difficulty=None, rng=None):
+    return _default.random_word(category, difficulty, rng)
@@ -0,0 +1,197 @@
+import argparse
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from types import MappingProxyType
+
+from .word_stats import dataset_stats
+
+# Compiled word pack layout (little-endian):
+#
+#   header     MAGIC, version, word count, directory length,
+#              offsets position, blob position
+#   directory  JSON {"ranges": [[category, difficulty, start, stop], ...],
+#              "stats": word_stats.dataset_stats()}, ranges category-major
+#              in dataset order
+#   offsets    (count + 1) uint32 byte offsets into the blob
+#   blob       UTF-8 words back to back
+#
+# Words are only decoded when they are looked up, straight out of the mmap.
+
+MAGIC = b"WMZPACK\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sIIIQQ")
+
+
+def is_pack(file_path):
+    try:
+        with open(file_path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def compile_pack(obj, file_path):
+    directory = []
+    offsets = array("I", [0])
+    blob = bytearray()
+
+    for cat, diffs in obj.items():
+        for diff, ws in diffs.items():
+            start = len(offsets) - 1
+            for w in ws:
+                blob += w.encode("utf-8")
+                try:
+                    offsets.append(len(blob))
+                except OverflowError:
+                    raise ValueError("word pack blob exceeds 4 GiB") from None
+            directory.append([cat, diff, start, len(offsets) - 1])
+
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    header = {"ranges": directory, "stats": dataset_stats(obj)}
+    dir_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    offsets_pos = HEADER.size + len(dir_bytes)
+    offsets_pos += -offsets_pos % offsets.itemsize
+    blob_pos = offsets_pos + len(offsets) * offsets.itemsize
+
+    with open(file_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(offsets) - 1, len(dir_bytes), offsets_pos, blob_pos))
+        f.write(dir_bytes)
+        f.write(b"\x00" * (offsets_pos - HEADER.size - len(dir_bytes)))
+        f.write(offsets.tobytes())
+        f.write(blob)
+
+
+class PackedWords(Sequence):
+    # A contiguous run of words inside a WordPack.
+    __slots__ = ("_pack", "_start", "_stop")
+
+    def __init__(self, pack, start, stop):
+        self._pack = pack
+        self._start = start
+        self._stop = stop
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step == 1:
+                return PackedWords(self._pack, self._start + start, self._start + max(start, stop))
+            return [self[j] for j in range(start, stop, step)]
+
+        n = self._stop - self._start
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("word index out of range")
+        return self._pack.word(self._start + i)
+
+
+class ChainedWords(Sequence):
+    # Several PackedWords viewed as one sequence (non-contiguous rollups).
+    __slots__ = ("_parts", "_ends")
+
+    def __init__(self, parts):
+        self._parts = tuple(parts)
+        self._ends = []
+        total = 0
+        for part in self._parts:
+            total += len(part)
+            self._ends.append(total)
+
+    def __len__(self):
+        return self._ends[-1] if self._ends else 0
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("word index out of range")
+        k = bisect.bisect_right(self._ends, i)
+        base = self._ends[k - 1] if k else 0
+        return self._parts[k][i - base]
+
+
+class WordPack:
+    def __init__(self, file_path):
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError("not a word pack")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, dir_len, offsets_pos, blob_pos = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError("not a word pack")
+        if version != VERSION:
+            raise ValueError(f"unsupported word pack version {version}")
+
+        raw = memoryview(self._mm)[offsets_pos:offsets_pos + 4 * (count + 1)]
+        if sys.byteorder == "little":
+            self._offsets = raw.cast("I")
+        else:
+            self._offsets = array("I", raw.tobytes())
+            self._offsets.byteswap()
+        self._blob_pos = blob_pos
+        self.count = count
+
+        directory = json.loads(self._mm[HEADER.size:HEADER.size + dir_len].decode("utf-8"))
+        self.data, self.index = self._build(directory["ranges"])
+        self.stats = directory["stats"]
+
+    def word(self, i):
+        a = self._blob_pos + self._offsets[i]
+        b = self._blob_pos + self._offsets[i + 1]
+        return self._mm[a:b].decode("utf-8")
+
+    def _build(self, directory):
+        data = {}
+        idx = {}
+        by_diff = {}
+        cat_spans = {}
+
+        for cat, diff, start, stop in directory:
+            pool = PackedWords(self, start, stop)
+            data.setdefault(cat, {})[diff] = pool
+            idx[(cat, diff)] = pool
+            by_diff.setdefault(diff, []).append(pool)
+            lo, hi = cat_spans.get(cat, (start, stop))
+            cat_spans[cat] = (min(lo, start), max(hi, stop))
+
+        for cat, (lo, hi) in cat_spans.items():
+            idx[(cat, None)] = PackedWords(self, lo, hi)
+
+        for diff, parts in by_diff.items():
+            idx[(None, diff)] = ChainedWords(parts)
+
+        idx[(None, None)] = PackedWords(self, 0, self.count)
+        return data, MappingProxyType(idx)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile words.json into a binary word pack.")
+    parser.add_argument("source", help="words.json to compile")
+    parser.add_argument("target", help="output word pack (e.g. data/words.wmp)")
+    args = parser.parse_args(argv)
+
+    with open(args.source, "r", encoding="utf-8") as f:
+        obj = json.load(f)
+
+    compile_pack(obj, args.target)
+
+
+if __name__ == "__main__":
+    main()
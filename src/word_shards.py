@@ -0,0 +1,105 @@
+import json
+import os
+import threading
+from collections.abc import Mapping
+
+from . import word_pack
+from .word_stats import dataset_stats
+
+# Split word datasets: a small manifest listing each category's
+# per-difficulty word counts, next to a word pack holding every word.
+# Opening a dataset reads only the manifest, so categories(), counts and
+# stats never touch the words; the pack is memory-mapped the first time a
+# word is needed, and from then on every pool (one category, or a rollup
+# across categories) is a range of the pack that decodes one word per
+# lookup. Nothing is parsed per category, and only the pages actually read
+# are brought in.
+
+MANIFEST = "manifest.json"
+FORMAT = "word-maze-shards"
+VERSION = 1
+PACK = "words.wmp"
+
+
+def is_shards(path):
+    if os.path.isdir(path):
+        return os.path.isfile(os.path.join(path, MANIFEST))
+    return os.path.basename(path) == MANIFEST
+
+
+def split_dataset(obj, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    word_pack.compile_pack(obj, os.path.join(out_dir, PACK))
+
+    categories = {cat: {"counts": {diff: len(ws) for diff, ws in diffs.items()}} for cat, diffs in obj.items()}
+    manifest = {
+        "format": FORMAT,
+        "version": VERSION,
+        "categories": categories,
+        "stats": dataset_stats(obj),
+        "pack": PACK,
+    }
+    with open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=4)
+
+
+class ShardCategories(Mapping):
+    # {category: {difficulty: words}}; keys come from the manifest, values
+    # from the pack.
+    def __init__(self, dataset):
+        self._dataset = dataset
+
+    def __getitem__(self, cat):
+        if cat not in self._dataset.manifest:
+            raise KeyError(cat)
+        return self._dataset.pack().data[cat]
+
+    def __iter__(self):
+        return iter(self._dataset.manifest)
+
+    def __len__(self):
+        return len(self._dataset.manifest)
+
+
+class ShardIndex:
+    # Same lookups as word_loader.build_index(), answered by the pack.
+    def __init__(self, dataset):
+        self.dataset = dataset
+
+    def get(self, key, default=None):
+        cat = key[0]
+        if cat is not None and cat not in self.dataset.manifest:
+            return default
+        return self.dataset.pack().index.get(key, default)
+
+
+class ShardedDataset:
+    def __init__(self, path):
+        if os.path.isdir(path):
+            path = os.path.join(path, MANIFEST)
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != FORMAT:
+            raise ValueError("not a word-maze shard manifest")
+        if manifest.get("version") != VERSION:
+            raise ValueError(f"unsupported shard manifest version {manifest.get('version')}")
+
+        self.root = os.path.dirname(os.path.abspath(path))
+        self.manifest = manifest["categories"]
+        self.stats = manifest["stats"]
+        self._pack_file = manifest["pack"]
+        self._pack = None
+        self._lock = threading.Lock()
+
+        self.data = ShardCategories(self)
+        self.index = ShardIndex(self)
+
+    def is_open(self):
+        return self._pack is not None
+
+    def pack(self):
+        if self._pack is None:
+            with self._lock:
+                if self._pack is None:
+                    self._pack = word_pack.WordPack(os.path.join(self.root, self._pack_file))
+        return self._pack
@@ -0,0 +1,50 @@
+from collections import Counter
+
+# Summary of a {category: {difficulty: [words]}} dataset, computed in one
+# pass when a dataset is loaded, compiled or split, so the UI never has to
+# rescan every word. Everything is JSON-friendly: word packs and shard
+# manifests store it as is. Lengths count characters of the upper-cased
+# word, letters count alphabetic characters the way GameState sees them.
+#
+#   words        total number of words
+#   min_length   shortest word (0 for an empty dataset)
+#   max_length   longest word
+#   mean_length  average length
+#   lengths      lengths[n] = number of words n characters long
+#   letters      {letter: occurrences}
+#   counts       {category: {difficulty: words}}
+
+
+def dataset_stats(obj):
+    lengths = []
+    letters = Counter()
+    counts = {}
+    total = 0
+    chars = 0
+
+    for cat, diffs in obj.items():
+        cat_counts = counts[cat] = {}
+        for diff, ws in diffs.items():
+            n = 0
+            for w in ws:
+                w = w.upper()
+                size = len(w)
+                if size >= len(lengths):
+                    lengths.extend([0] * (size + 1 - len(lengths)))
+                lengths[size] += 1
+                letters.update(ch for ch in w if ch.isalpha())
+                chars += size
+                n += 1
+            cat_counts[diff] = n
+            total += n
+
+    present = [size for size, n in enumerate(lengths) if n]
+    return {
+        "words": total,
+        "min_length": present[0] if present else 0,
+        "max_length": present[-1] if present else 0,
+        "mean_length": chars / total if total else 0.0,
+        "lengths": lengths,
+        "letters": dict(sorted(letters.items())),
+        "counts": counts,
+    }
@@ -79,3 +79,621 @@ def test_progress_update_and_reset(tmp_path):
     reset_progress(str(p))
     prog3 = get_progress(str(p))
     assert prog3 == {"total_score": 0, "games_played": 0, "wins": 0, "losses": 0}
+
+
+def test_word_index_rollups():
+    from src import word_loader
+
+    word_loader.load_data({
+        "colors": {"easy": ["red", "blue"], "hard": ["magenta"]},
+        "fruits": {"easy": ["apple"]},
+    })
+
+    assert word_loader.words("colors", "easy") == ("red", "blue")
+    assert word_loader.words("colors") == ("red", "blue", "magenta")
+    assert word_loader.words(difficulty="easy") == ("red", "blue", "apple")
+    assert word_loader.words() == ("red", "blue", "magenta", "apple")
+    assert word_loader.words("nope", "easy") == ()
+
+    # lookups hand out the indexed pool itself, not a fresh copy
+    assert word_loader.words("colors") is word_loader.words("colors")
+
+
+def test_random_word_cycles_pool_without_repeats():
+    from src import word_loader
+
+    pool = ["w%d" % i for i in range(50)]
+    word_loader.load_data({"c": {"easy": pool}})
+
+    first = [word_loader.random_word("c", "easy") for _ in range(50)]
+    assert sorted(first) == sorted(pool)
+
+    # exhausted deck reshuffles instead of failing
+    second = [word_loader.random_word("c", "easy") for _ in range(50)]
+    assert sorted(second) == sorted(pool)
+
+
+def test_get_random_word_seed_is_reproducible_after_reload(tmp_path):
+    words = {"c": {"easy": ["w%d" % i for i in range(20)]}}
+    p = tmp_path / "words.json"
+    p.write_text(json.dumps(words), encoding="utf-8")
+
+    load_word_data(str(p))
+    a = [get_random_word("c", "easy", seed=s) for s in range(5)]
+    load_word_data(str(p))
+    b = [get_random_word("c", "easy", seed=s) for s in range(5)]
+    assert a == b
+    assert len(set(a)) == 5
+
+
+def test_word_loader_sessions_are_isolated_and_thread_safe():
+    import threading
+
+    from src.word_loader import WordLoader
+
+    pool = ["w%d" % i for i in range(400)]
+    loader = WordLoader({"c": {"easy": pool}})
+    other = loader.session()
+    assert other.words("c", "easy") is loader.words("c", "easy")
+
+    drawn = []
+    lock = threading.Lock()
+
+    def worker():
+        got = [loader.random_word("c", "easy") for _ in range(100)]
+        with lock:
+            drawn.extend(got)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # two full cycles through the deck, every word exactly twice
+    assert sorted(drawn) == sorted(pool * 2)
+
+    # the session kept its own history
+    assert sorted(other.random_word("c", "easy") for _ in range(400)) == sorted(pool)
+
+
+def test_compiled_word_pack_round_trips(tmp_path):
+    from project import compile_word_pack
+    from src import word_loader
+
+    words = {
+        "colors": {"easy": ["red", "blue"], "hard": ["magenta"]},
+        "cities": {"easy": ["Zürich"], "hard": ["Reykjavík", "São Paulo"]},
+    }
+    src = tmp_path / "words.json"
+    src.write_text(json.dumps(words), encoding="utf-8")
+    pack = compile_word_pack(str(src), str(tmp_path / "words.wmp"))
+
+    word_loader.load(pack)
+    assert word_loader.categories() == ["colors", "cities"]
+    assert list(word_loader.words("cities", "hard")) == ["Reykjavík", "São Paulo"]
+    assert list(word_loader.words("colors")) == ["red", "blue", "magenta"]
+    assert list(word_loader.words(difficulty="easy")) == ["red", "blue", "Zürich"]
+    assert len(word_loader.words()) == 6
+    assert word_loader.words(difficulty="hard")[-1] == "São Paulo"
+    assert word_loader.random_word("cities", "easy") == "Zürich"
+
+    loaded = load_word_data(pack)
+    assert list(loaded["colors"]["easy"]) == ["red", "blue"]
+
+
+def test_word_stats_are_the_same_for_json_pack_and_shards(tmp_path):
+    from project import compile_word_pack, get_word_stats, split_word_data
+
+    words = {
+        "colors": {"easy": ["red", "blue"], "hard": ["magenta"]},
+        "cities": {"easy": ["Zürich"], "hard": ["Reykjavík", "São Paulo"]},
+    }
+    src = tmp_path / "words.json"
+    src.write_text(json.dumps(words), encoding="utf-8")
+
+    load_word_data(str(src))
+    stats = get_word_stats()
+    assert (stats["words"], stats["min_length"], stats["max_length"]) == (6, 3, 9)
+    assert stats["mean_length"] == 38 / 6
+    assert stats["lengths"][9] == 2 and sum(stats["lengths"]) == 6
+    assert stats["letters"]["Ü"] == 1 and stats["letters"]["A"] == 4 and " " not in stats["letters"]
+    assert stats["counts"] == {"colors": {"easy": 2, "hard": 1}, "cities": {"easy": 1, "hard": 2}}
+
+    for built in (compile_word_pack(str(src), str(tmp_path / "words.wmp")),
+                  split_word_data(str(src), str(tmp_path / "words"))):
+        load_word_data(built)
+        assert get_word_stats() == stats
+
+
+def test_streaming_schema_validation(tmp_path):
+    import io
+
+    from project import _stream_words_schema, validate_words_file
+
+    words = {
+        "colors": {"easy": ["red", "bl\\u00fce"], "hard": ["magenta"]},
+        "cities": {"easy": ["Zürich", "São Paulo"]},
+    }
+    raw = json.dumps(words, ensure_ascii=False, indent=2).encode("utf-8")
+
+    # tiny chunks force tokens to straddle read boundaries
+    assert _stream_words_schema(io.BytesIO(raw), chunk_size=3) == json.loads(raw)
+
+    p = tmp_path / "words.json"
+    p.write_bytes(raw)
+    assert load_word_data(str(p), stream=True) == json.loads(raw)
+    validate_words_file(str(p))
+
+    bad = b'{"animals": {"easy": ["cat", 7, "dog"]}}'
+    with pytest.raises(ValueError, match=r'\$\["animals"\]\["easy"\]\[1\] \(byte 29\)'):
+        _stream_words_schema(io.BytesIO(bad), chunk_size=4)
+
+    for doc in (b"", b"[]", b"{}", b'{"a": {}}', b'{"a": {"e": []}}', b'{"a": {"e": ["x"]}', b'{"a": {"e": ["x"]}} 1'):
+        with pytest.raises(ValueError):
+            _stream_words_schema(io.BytesIO(doc))
+
+
+def test_sharded_dataset_loads_categories_lazily(tmp_path):
+    from project import split_word_data
+    from src import word_loader
+
+    words = {
+        "colors": {"easy": ["red", "blue"], "hard": ["magenta"]},
+        "fruits": {"easy": ["apple"], "hard": ["pomegranate"]},
+        "animals": {"easy": ["cat"]},
+    }
+    src = tmp_path / "words.json"
+    src.write_text(json.dumps(words), encoding="utf-8")
+    out = split_word_data(str(src), str(tmp_path / "words"))
+    assert sorted(x.name for x in (tmp_path / "words").iterdir()) == ["manifest.json", "words.wmp"]
+
+    word_loader.load(out)
+    shards = word_loader.index.dataset
+
+    # categories and stats come from the manifest alone
+    assert word_loader.categories() == ["colors", "fruits", "animals"]
+    assert word_loader.stats()["words"] == 6
+    assert not shards.is_open()
+
+    assert list(word_loader.words("colors", "easy")) == ["red", "blue"]
+    assert shards.is_open()
+    assert list(word_loader.words("fruits")) == ["apple", "pomegranate"]
+    assert word_loader.random_word("animals", "easy") == "cat"
+    assert word_loader.words("animals", "hard") == ()
+    assert word_loader.words("nope") == ()
+
+    assert list(word_loader.words(difficulty="easy")) == ["red", "blue", "apple", "cat"]
+    drawn = sorted(word_loader.random_word() for _ in range(6))
+    assert drawn == sorted(w for diffs in words.values() for ws in diffs.values() for w in ws)
+
+
+ROUNDS = [
+    ("CAT", ["c", "a", "t"]),
+    ("A", list("BCDEFGHI")),
+    ("New York", list("nweyorkz")),
+    ("banana", ["b", "b", "x", "1", "", "a", "n"]),
+    ("Hippopotamus", list("zpoaqhitmus")),
+    ("Mango", list("qwrtyuio")),
+]
+
+
+def _simulate_one_by_one(rounds, use_hint):
+    return [simulate_round(w, g, use_hint=use_hint) for w, g in rounds]
+
+
+@pytest.mark.parametrize("use_hint", [False, True])
+def test_simulate_rounds_matches_simulate_round(use_hint):
+    import random
+
+    from project import simulate_rounds
+
+    random.seed(7)
+    expected = _simulate_one_by_one(ROUNDS, use_hint)
+    random.seed(7)
+    batch = simulate_rounds(ROUNDS, use_hint=use_hint, vectorize=False)
+
+    assert len(batch) == len(ROUNDS)
+    assert list(batch) == expected
+    assert list(batch.won) == [r.won for r in expected]
+
+
+@pytest.mark.parametrize("use_hint", [False, True])
+def test_simulate_rounds_numpy_matches_python(use_hint):
+    pytest.importorskip("numpy")
+    from project import simulate_rounds
+
+    fast = simulate_rounds(ROUNDS * 5, use_hint=use_hint, seed=3, vectorize=True)
+    slow = simulate_rounds(ROUNDS * 5, use_hint=use_hint, seed=3, vectorize=False)
+    assert list(fast) == list(slow)
+
+    # multi-letter, non-ASCII and non-string guesses are ignored the same way
+    for extra in (["zü", "ü", "Z", "r", "ich", "i", "c", "h"], ["zü", "ü", "Z", 7, "r", "ich", "i", "c", "h"]):
+        odd = ROUNDS + [("Zürich", extra), ("São", ["s", "ã", "o"])]
+        fast = simulate_rounds(odd, use_hint=use_hint, seed=3, vectorize=True)
+        slow = simulate_rounds(odd, use_hint=use_hint, seed=3, vectorize=False)
+        assert list(fast) == list(slow)
+
+
+def test_simulate_rounds_parallel_is_deterministic_across_worker_counts(tmp_path):
+    from project import simulate_rounds, simulate_rounds_parallel
+
+    words = {"fruits": {"easy": ["apple", "banana", "cherry", "mango", "kiwi"]}}
+    p = tmp_path / "words.json"
+    p.write_text(json.dumps(words), encoding="utf-8")
+
+    guesses = list("aeiounrtbcmk")
+    jobs = [(None, guesses) for _ in range(40)] + ROUNDS
+
+    def run(workers):
+        return list(simulate_rounds_parallel(
+            jobs, workers=workers, chunk_size=7, seed=11, use_hint=True,
+            category="fruits", difficulty="easy", file_path=str(p),
+        ))
+
+    inline = run(1)
+    assert len(inline) == len(jobs)
+    assert inline == run(3)
+
+    # explicit words without hints don't depend on the rng at all
+    tail = list(simulate_rounds_parallel(ROUNDS, workers=2, chunk_size=2, file_path=str(p)))
+    assert tail == list(simulate_rounds(ROUNDS, vectorize=False))
+
+
+def test_game_state_is_compact_and_tracks_reveals():
+    from src.game_state import GameState
+
+    state = GameState("New-York")
+    assert not hasattr(state, "__dict__")
+    assert state.revealed == {3}
+
+    assert state.guess("o") == {"correct": True, "points": 10, "score": 10, "lives": 8}
+    assert state.is_revealed(5) and not state.is_revealed(0)
+    assert state.revealed_mask == 0b101000
+
+    # guessed letters are a read-only snapshot of an int mask
+    state.guessed.add("Q")
+    assert state.guessed == {"O"}
+
+    for letter in "newyrk":
+        state.guess(letter)
+    assert state.is_won()
+    assert state.masked() == "N E W - Y O R K"
+    assert state.finish_round() == {"round_score": 100, "won": True, "bonus": 30, "mistakes": 0}
+
+
+def test_game_state_handles_letters_outside_a_to_z():
+    from src.game_state import GameState
+
+    state = GameState("Café")
+    assert state.guess("é")["correct"] is True
+    assert state.guess("ü")["correct"] is False
+    assert state.guess("Ü") == {"already_guessed": True, "lives": 7, "score": 10}
+    state.guess("z")
+    assert state.guessed == {"É", "Ü", "Z"}
+    assert state.wrong_letters() == ("Z", "Ü")
+    assert state.masked() == "_ _ _ É"
+
+
+def test_game_state_caches_masked_word_and_wrong_letters():
+    from src.game_state import GameState
+
+    state = GameState("cat")
+    masked = state.masked()
+    assert masked == "_ _ _"
+    assert state.masked() is masked
+
+    state.guess("z")
+    state.guess("b")
+    assert state.masked() is masked
+    assert state.wrong_letters() == ("B", "Z")
+    assert state.wrong_letters() is state.wrong_letters()
+
+    state.guess("a")
+    assert state.masked() == "_ A _"
+    assert state.wrong_letters() == ("B", "Z")
+
+
+def test_progress_writes_are_atomic_and_fall_back_to_backup(tmp_path):
+    p = tmp_path / "save.json"
+
+    update_progress(10, True, path=str(p))
+    update_progress(5, False, path=str(p))
+    assert sorted(x.name for x in tmp_path.iterdir()) == ["save.json", "save.json.bak", "save.json.lock"]
+
+    # a torn write of the main file falls back to the previous save
+    p.write_text('{"total_score": 1', encoding="utf-8")
+    restored = get_progress(str(p))
+    assert restored == {"total_score": 10, "games_played": 1, "wins": 1, "losses": 0}
+    # the file also carries the save counter optimistic updates compare
+    on_disk = json.loads(p.read_text(encoding="utf-8"))
+    assert on_disk.pop("_version") == 1
+    assert on_disk == restored
+
+
+@pytest.mark.parametrize("backend", ["json", "journal", "sqlite"])
+def test_update_progress_many_applies_batch_in_one_cycle(tmp_path, backend):
+    from project import update_progress_many
+
+    path = str(tmp_path / "save.db")
+    update_progress(10, True, path=path, backend=backend)
+
+    win = simulate_round("CAT", list("CAT"))
+    out = update_progress_many([win, (5, False), (0, False)], path=path, backend=backend)
+    assert out.delta == {"total_score": win.round_score + 5, "games_played": 3, "wins": 1, "losses": 2}
+    assert out.totals == {"total_score": win.round_score + 15, "games_played": 4, "wins": 2, "losses": 2}
+    assert get_progress(path, backend=backend) == out.totals
+
+    assert update_progress_many([], path=path, backend=backend).delta["games_played"] == 0
+    with pytest.raises(TypeError):
+        update_progress_many([(1, True), ("2", True)], path=path, backend=backend)
+    with pytest.raises(TypeError):
+        update_progress_many([(1, 1)], path=path, backend=backend)
+    assert get_progress(path, backend=backend) == out.totals
+
+
+def _hammer_progress(path, mode, rounds):
+    from src import progress_manager
+
+    for _ in range(rounds):
+        progress_manager.update(path, {"round_score": 1, "won": True}, mode)
+
+
+@pytest.mark.parametrize("mode", ["exclusive", "optimistic"])
+def test_progress_updates_from_many_processes_are_not_lost(tmp_path, mode):
+    from concurrent.futures import ProcessPoolExecutor
+
+    path = str(tmp_path / "save.json")
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        for f in [pool.submit(_hammer_progress, path, mode, 25) for _ in range(4)]:
+            f.result()
+
+    assert get_progress(path) == {"total_score": 100, "games_played": 100, "wins": 100, "losses": 0}
+
+
+def _hammer_journal(path, rounds):
+    from src import progress_manager
+
+    # compact often so processes keep folding each other's records
+    progress_manager.open_store(path, "journal").max_records = 7
+    for i in range(rounds):
+        update_progress(1, i % 5 != 0, path=path, backend="journal")
+
+
+def test_journal_updates_from_many_processes_are_not_lost(tmp_path):
+    from concurrent.futures import ProcessPoolExecutor
+
+    path = str(tmp_path / "save.json")
+    reader = get_progress(path, backend="journal")
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        for f in [pool.submit(_hammer_journal, path, 25) for _ in range(4)]:
+            f.result()
+
+    # a store opened before the others wrote still sees their rounds
+    expected = {"total_score": 100, "games_played": 100, "wins": 80, "losses": 20}
+    assert get_progress(path, backend="journal") == expected != reader
+
+
+def test_journal_backend_matches_json_and_compacts(tmp_path):
+    from src import progress_manager
+
+    j = str(tmp_path / "journal.json")
+    plain = str(tmp_path / "plain.json")
+    store = progress_manager.open_store(j, "journal")
+    store.max_records = 3
+
+    for score, won in [(10, True), (0, False), (25, True), (40, True), (5, False)]:
+        a = update_progress(score, won, path=j, backend="journal")
+        b = update_progress(score, won, path=plain)
+        assert a == b
+
+    # compaction folded three rounds into the snapshot, two remain journaled
+    assert len((tmp_path / "journal.json.journal").read_text().splitlines()) == 2
+
+    # a fresh store rebuilds the same totals from disk, ignoring a torn record
+    with open(j + ".journal", "a", encoding="utf-8") as f:
+        f.write('{"n":99,"s":1')
+    fresh = progress_manager.JournalStore(j)
+    assert fresh.load() == get_progress(plain)
+
+    reset_progress(j, backend="journal")
+    assert get_progress(j, backend="journal") == {"total_score": 0, "games_played": 0, "wins": 0, "losses": 0}
+
+
+def test_sqlite_backend_imports_json_and_ranks_players(tmp_path):
+    from project import get_leaderboard, get_player_stats
+    from src import progress_manager
+
+    legacy = tmp_path / "save.json"
+    legacy.write_text(json.dumps({"total_score": 100, "games_played": 4, "wins": 3, "losses": 1}))
+    db = str(tmp_path / "save.sqlite")
+
+    assert get_progress(db) == {"total_score": 100, "games_played": 4, "wins": 3, "losses": 1}
+
+    store = progress_manager.open_store(db)
+    totals = store.update_many([
+        {"player": "ayla", "category": "fruits", "difficulty": "easy", "word": "KIWI", "round_score": 70, "won": True},
+        {"player": "sam", "round_score": 20, "won": False, "mistakes": 8},
+        {"player": "ayla", "round_score": 40, "won": True},
+    ])
+    assert totals == {"total_score": 230, "games_played": 7, "wins": 5, "losses": 2}
+    assert update_progress(5, False, path=db)["games_played"] == 8
+
+    board = get_leaderboard(path=db)
+    assert [(r["player"], r["total_score"], r["best_score"]) for r in board] == [("ayla", 110, 70), ("sam", 20, 20)]
+    assert get_player_stats("sam", path=db)["losses"] == 1
+    assert progress_manager.top_rounds(db, 1)[0]["word"] == "KIWI"
+
+    # the JSON save is imported only once
+    second = progress_manager.SqliteStore(db)
+    assert second.load()["games_played"] == 8
+    second.close()
+    reset_progress(db)
+    assert get_progress(db)["games_played"] == 0
+    assert get_leaderboard(path=db) == []
+
+
+def test_progress_writer_coalesces_writes_off_thread(tmp_path):
+    from src import progress_manager
+
+    path = str(tmp_path / "save.json")
+    writer = progress_manager.ProgressWriter(path, interval=60)
+    calls = []
+    update_many = writer.store.update_many
+    writer.store.update_many = lambda results: calls.append(len(results)) or update_many(results)
+
+    for score in (10, 20, 30):
+        totals = writer.submit({"round_score": score, "won": score > 10})
+    # totals are current immediately, the file catches up on flush
+    assert totals == {"total_score": 60, "games_played": 3, "wins": 2, "losses": 1}
+    assert get_progress(path)["games_played"] == 0
+
+    writer.flush()
+    assert calls == [3]
+    assert get_progress(path) == totals
+
+    writer.submit({"round_score": 5, "won": False})
+    writer.close()
+    writer.close()
+    assert get_progress(path)["total_score"] == 65
+    with pytest.raises(RuntimeError):
+        writer.submit({"round_score": 1, "won": True})
+
+
+def test_progress_writer_keeps_results_the_store_rejects(tmp_path):
+    from src import progress_manager
+
+    path = str(tmp_path / "save.json")
+    writer = progress_manager.ProgressWriter(path, interval=60)
+    update_many = writer.store.update_many
+    failing = [True]
+
+    def flaky(results):
+        if failing[0]:
+            raise OSError("disk full")
+        return update_many(results)
+
+    writer.store.update_many = flaky
+    writer.submit({"round_score": 10, "won": True})
+    with pytest.raises(RuntimeError) as info:
+        writer.flush()
+    assert isinstance(info.value.__cause__, OSError)
+
+    # the failed batch goes out with the next flush once the store recovers
+    failing[0] = False
+    writer.flush()
+    assert get_progress(path)["total_score"] == 10
+
+    # what close() can't write is kept on disk and replayed by the next writer
+    failing[0] = True
+    writer.submit({"round_score": 5, "won": False})
+    writer.submit({"round_score": 7, "won": True})
+    assert isinstance(writer.close(), OSError)
+    assert get_progress(path)["total_score"] == 10
+    assert len(progress_manager.read_pending(writer.pending)) == 2
+
+    writer.store.update_many = update_many
+    again = progress_manager.ProgressWriter(path, interval=60)
+    assert again.totals() == {"total_score": 22, "games_played": 3, "wins": 2, "losses": 1}
+    assert not (tmp_path / "save.json.pending").exists()
+    assert again.close() is None
+
+
+def test_core_bench_datasets_are_seeded_and_compare_flags_regressions():
+    from benchmarks.core_bench import compare, merge_runs, synthetic_dataset
+
+    data = synthetic_dataset(100, seed=7)
+    assert data == synthetic_dataset(100, seed=7) != synthetic_dataset(100, seed=8)
+    assert sum(len(ws) for diffs in data.values() for ws in diffs.values()) == 100
+
+    baseline = {"results": {"a": {"us_per_op": 10.0}, "b": {"us_per_op": 10.0}, "c": {"us_per_op": 10.0}}}
+    report = {"results": {"a": {"us_per_op": 12.0}, "b": {"us_per_op": 14.0}, "c": {"us_per_op": 5.0},
+                          "d": {"us_per_op": 1.0}}}
+    statuses = {name: entry["status"] for name, entry in compare(report, baseline, tolerance=0.25).items()}
+    assert statuses == {"a": "ok", "b": "regressed", "c": "improved", "d": "new"}
+
+    # disk I/O cases are held to their own, looser tolerance
+    baseline = {"results": {"a": {"us_per_op": 10.0}, "progress_manager.update[json]": {"us_per_op": 10.0}}}
+    report = {"results": {"a": {"us_per_op": 20.0}, "progress_manager.update[json]": {"us_per_op": 20.0}}}
+    statuses = {name: entry["status"] for name, entry in compare(report, baseline, 0.25, io_tolerance=1.5).items()}
+    assert statuses == {"a": "regressed", "progress_manager.update[json]": "ok"}
+
+    runs = [{"params": {}, "results": {"a": {"us_per_op": t}, "b": {"us_per_op": 12.0 - t}}} for t in (4.0, 7.0, 5.0)]
+    merged = merge_runs(runs)
+    assert merged["results"] == {"a": {"us_per_op": 7.0}, "b": {"us_per_op": 8.0}} and merged["params"]["runs"] == 3
+
+
+def test_solver_narrows_candidates_and_ranks_letters():
+    from project import make_solver
+    from src import word_loader
+    from src.game_state import GameState
+
+    word_loader.load_data({"animals": {"easy": ["cat", "car", "cap", "cot", "dog", "bat", "cow", "horse"]}})
+
+    state = GameState("cat")
+    s = make_solver(state, "animals", "easy")
+    assert sorted(s.candidates()) == ["bat", "cap", "car", "cat", "cot", "cow", "dog"]
+
+    state.guess("C")
+    assert s.update() == 5
+    assert sorted(s.candidates()) == ["cap", "car", "cat", "cot", "cow"]
+
+    state.guess("O")  # wrong: rules out cot and cow
+    state.guess("T")
+    assert s.update() == 1 and s.candidates() == ["cat"]
+
+    # cap/car/cat/cot/cow left: A, O and T split them 3/2, P only 1/4, D not at all
+    s = make_solver(GameState("car"), "animals", "easy")
+    s.state.guess("C")
+    s.update()
+    ranked = dict(s.rank_letters())
+    assert ranked["A"] == ranked["O"] == ranked["T"] > ranked["P"] > ranked["D"] == 0
+    assert "C" not in ranked
+    assert s.best_letter(by="elimination") == "A"
+
+
+def test_solver_matches_the_spaces_of_multi_word_entries():
+    from project import make_solver
+    from src import word_loader
+    from src.game_state import GameState
+
+    word_loader.load_data({"food": {"easy": ["Ice Cream", "Icecreams", "Pad Thai", "Pad-Thai", "Padthais"]}})
+
+    # the target's spaces show from the first frame, and so would a candidate's
+    assert make_solver(GameState("Icecreams"), "food", "easy").candidates() == ["Icecreams"]
+    assert make_solver(GameState("Ice Cream"), "food", "easy").candidates() == ["Ice Cream"]
+    assert make_solver(GameState("Padthais"), "food", "easy").candidates() == ["Padthais"]
+
+    s = make_solver(GameState("Pad Thai"), "food", "easy")
+    assert s.candidates() == ["Pad Thai"] and s.rank_letters()[0][1] == 0
+
+
+def test_solver_repacks_few_candidates_and_remembers_large_rankings(monkeypatch):
+    import random
+
+    from src import solver
+    from src.game_state import GameState
+
+    rng = random.Random(3)
+    pool = tuple("".join(rng.choices("ABCDEFGHIJ", k=6)) for _ in range(5000))
+    index = solver.WordIndex(pool)
+
+    def play(word):
+        state = GameState(word)
+        s = solver.Solver(state, index=index)
+        trace = [(s.count(), s.rank_letters())]
+        for letter in "ABCD":
+            state.guess(letter)
+            s.update()
+            trace.append((s.count(), sorted(s.candidates()), s.rank_letters()))
+        return s, trace
+
+    monkeypatch.setattr(solver, "REPACK_MAX", 100)
+    s, repacked = play(pool[0])
+    assert len(s.table.ids) == s.count() <= 100  # down to its own table of candidates
+    assert index.ranking((6, 0, "", frozenset(), "information")) is not None
+
+    monkeypatch.setattr(solver, "REPACK_MAX", 0)
+    s, full = play(pool[0])
+    assert s.table is index.table(6)
+    assert repacked == full